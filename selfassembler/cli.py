@@ -17,7 +17,7 @@ from selfassembler.errors import (
     SelfAssemblerError,
 )
 from selfassembler.orchestrator import Orchestrator, create_orchestrator
-from selfassembler.phases import PHASE_NAMES
+from selfassembler.phases import PHASE_INDEX, PHASE_NAMES
 from selfassembler.state import CheckpointManager
 
 
@@ -360,21 +360,22 @@ def handle_help_phases(phase_names: list[str] | None) -> int:
     Returns:
         0 on success, 1 on invalid phase name.
     """
-    from selfassembler.phases import PHASE_CLASSES, PHASE_NAMES
+    from selfassembler.phases import PHASE_CLASSES, PHASE_INDEX, PHASE_NAMES
 
     term_width = shutil.get_terminal_size().columns
     separator = "=" * term_width
 
     # If specific phases requested, validate them
     if phase_names:
-        invalid_phases = [p for p in phase_names if p not in PHASE_NAMES]
+        invalid_phases = [p for p in phase_names if p not in PHASE_INDEX]
         if invalid_phases:
             print(f"Error: Unknown phase(s): {', '.join(invalid_phases)}", file=sys.stderr)
             print(f"\nValid phases: {', '.join(PHASE_NAMES)}", file=sys.stderr)
             return 1
 
         # Filter to requested phases
-        phases_to_show = [cls for cls in PHASE_CLASSES if cls.name in phase_names]
+        requested = set(phase_names)
+        phases_to_show = [cls for cls in PHASE_CLASSES if cls.name in requested]
     else:
         phases_to_show = PHASE_CLASSES
 
@@ -390,7 +391,7 @@ def handle_help_phases(phase_names: list[str] | None) -> int:
     # Print each phase
     total_phases = len(PHASE_CLASSES)
     for phase_class in phases_to_show:
-        phase_num = PHASE_CLASSES.index(phase_class) + 1
+        phase_num = PHASE_INDEX[phase_class.name] + 1
         _print_phase_help(phase_class, phase_num, total_phases)
         print()
 
@@ -403,14 +404,14 @@ def handle_dry_run(config: WorkflowConfig, skip_to: str | None = None) -> int:
     Shows phase name, approval gate status, estimated cost, and running total.
     Respects --skip-to and disabled phases configuration.
     """
-    from selfassembler.phases import PHASE_CLASSES, PHASE_NAMES
+    from selfassembler.phases import PHASE_CLASSES, PHASE_INDEX
 
     # Determine start index based on skip_to
     start_index = 0
     if skip_to:
         try:
-            start_index = PHASE_NAMES.index(skip_to)
-        except ValueError:
+            start_index = PHASE_INDEX[skip_to]
+        except KeyError:
             print(f"Unknown phase: {skip_to}", file=sys.stderr)
             return 1
 
@@ -654,6 +655,7 @@ def main(args: list[str] | None = None) -> int:
                 orchestrator.config.streaming.enabled = False
             if parsed.debug:
                 orchestrator.config.streaming.debug = parsed.debug
+            orchestrator._rebind_config()  # Pick up overrides in cached config values
 
             # Recreate executor so streaming/debug overrides take effect
             if parsed.no_stream or parsed.debug:
@@ -669,7 +671,7 @@ def main(args: list[str] | None = None) -> int:
             if parsed.skip_phases:
                 for phase in parsed.skip_phases.split(","):
                     phase = phase.strip()
-                    if phase in PHASE_NAMES:
+                    if phase in PHASE_INDEX:
                         orchestrator.context.mark_phase_complete(phase)
                         print(f"Skipping phase: {phase}")
                     else:
@@ -679,7 +681,7 @@ def main(args: list[str] | None = None) -> int:
 
             # --skip-to with --resume: mark all phases before target as complete
             if parsed.skip_to:
-                skip_idx = PHASE_NAMES.index(parsed.skip_to)
+                skip_idx = PHASE_INDEX[parsed.skip_to]
                 for phase_name in PHASE_NAMES[:skip_idx]:
                     orchestrator.context.mark_phase_complete(phase_name)
                 orchestrator.run_workflow(skip_to=parsed.skip_to)
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import os
+import re
 import shlex
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -206,16 +208,101 @@ def _check_command_available(workdir: Path, cmd: str, project_type: str) -> bool
         if script_name not in ("install", "ci", "init", "publish"):
             return _check_npm_script_exists(workdir, script_name)
 
-    # Check if executable exists
+    # Project-local executables (./gradlew) are resolved against the project,
+    # everything else against PATH; neither needs a `which` subprocess.
+    if "/" in executable or os.sep in executable:
+        path = workdir / executable
+        return path.is_file() and os.access(path, os.X_OK)
+    return shutil.which(executable) is not None
+
+
+# Files where a Python project declares its (dev) dependencies.
+_PYTHON_DEPENDENCY_FILES = (
+    "pyproject.toml",
+    "setup.cfg",
+    "setup.py",
+    "requirements.txt",
+    "requirements-dev.txt",
+)
+
+
+def _declares_dependency(workdir: Path, package: str) -> bool:
+    """Check whether a Python project lists a package in its dependency files."""
+    for name in _PYTHON_DEPENDENCY_FILES:
+        try:
+            text = (workdir / name).read_text(errors="replace")
+        except OSError:
+            continue
+        if package in text.lower():
+            return True
+    return False
+
+
+def _python_can_import(interpreter: list[str], module: str) -> bool:
+    """Check whether a Python interpreter (argv prefix) can import a module."""
     try:
         result = subprocess.run(
-            ["which" if os.name != "nt" else "where", executable],
+            [
+                *interpreter,
+                "-c",
+                f"import importlib.util, sys; sys.exit(importlib.util.find_spec({module!r}) is None)",
+            ],
             capture_output=True,
-            timeout=5,
+            timeout=30,
         )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    except (OSError, subprocess.TimeoutExpired):
         return False
+    return result.returncode == 0
+
+
+def _pytest_interpreter(parts: list[str]) -> list[str] | None:
+    """Resolve the interpreter a ``pytest``/``python -m pytest`` command runs under."""
+    executable = shutil.which(parts[0])
+    if executable is None:
+        return None
+    if parts[0] != "pytest":
+        return [executable]
+    # The pytest console script names its interpreter in the shebang
+    try:
+        with open(executable, "rb") as f:
+            shebang = f.readline()
+    except OSError:
+        return None
+    if not shebang.startswith(b"#!"):
+        return None
+    return shebang[2:].decode(errors="replace").split() or None
+
+
+def available_cores() -> int:
+    """Number of CPUs this process may run on (respects affinity/cpusets)."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:  # Not available on macOS/Windows
+        return max(1, os.cpu_count() or 1)
+
+
+def parallelize_test_command(cmd: str, workdir: Path) -> str:
+    """Spread an auto-detected test command across CPU cores where it is safe.
+
+    Only pytest needs help: ``go test``, ``cargo test`` and jest already run
+    tests in parallel. pytest is given ``-n auto`` when more than two cores
+    are available (on smaller runners the worker startup costs more than it
+    saves) and the project declares pytest-xdist. A declared dependency may
+    not be installed, and pytest rejects ``-n`` without the plugin, so the
+    interpreter that runs the tests must also be able to import ``xdist``.
+    """
+    parts = cmd.split()
+    is_pytest = parts[:1] == ["pytest"] or parts[:3] == ["python", "-m", "pytest"]
+    if (
+        is_pytest
+        and "-n" not in parts
+        and available_cores() > 2
+        and _declares_dependency(workdir, "pytest-xdist")
+    ):
+        interpreter = _pytest_interpreter(parts)
+        if interpreter and _python_can_import(interpreter, "xdist"):
+            return f"{cmd} -n auto"
+    return cmd
 
 
 def get_command(
@@ -245,6 +332,8 @@ def get_command(
 
     for cmd in candidates:
         if _check_command_available(workdir, cmd, project_type):
+            if command_type == "test":
+                return parallelize_test_command(cmd, workdir)
             return cmd
 
     return None
@@ -316,6 +405,13 @@ def run_command(
         return False, "", f"Command failed: {e}"
 
 
+# Failure-line patterns for extract_failure_ids, tried in this order
+_PYTEST_FAILURE_RE = re.compile(r"FAILED\s+([\w/\\.:]+(?:::\w+)+)")
+_GO_FAILURE_RE = re.compile(r"---\s+FAIL:\s+(\S+)")
+_CARGO_FAILURE_RE = re.compile(r"test\s+([\w:]+)\s+\.\.\.\s+FAILED")
+_JEST_FAILURE_RE = re.compile(r"FAIL\s+(.+)")
+
+
 def extract_failure_ids(failure_lines: list[str]) -> list[str]:
     """Extract structured test IDs from failure lines.
 
@@ -329,8 +425,6 @@ def extract_failure_ids(failure_lines: list[str]) -> list[str]:
     - cargo: ``test mod::path::test_name ... FAILED``
     - jest: ``FAIL src/file.test.js > Suite > test name``
     """
-    import re
-
     ids: list[str] = []
     seen: set[str] = set()
 
@@ -343,25 +437,25 @@ def extract_failure_ids(failure_lines: list[str]) -> list[str]:
 
         # pytest: "FAILED path/test.py::Class::test_name - reason"
         # Also matches short summary lines like "FAILED path/test.py::test_name"
-        m = re.match(r"FAILED\s+([\w/\\.:]+(?:::\w+)+)", stripped)
+        m = _PYTEST_FAILURE_RE.match(stripped)
         if m:
             fid = m.group(1)
 
         # go: "--- FAIL: TestName/SubTest (0.01s)"
         if fid is None:
-            m = re.match(r"---\s+FAIL:\s+(\S+)", stripped)
+            m = _GO_FAILURE_RE.match(stripped)
             if m:
                 fid = m.group(1)
 
         # cargo: "test mod::path::test_name ... FAILED"
         if fid is None:
-            m = re.match(r"test\s+([\w:]+)\s+\.\.\.\s+FAILED", stripped)
+            m = _CARGO_FAILURE_RE.match(stripped)
             if m:
                 fid = m.group(1)
 
         # jest: "FAIL src/file.test.js > Suite > test name"
         if fid is None:
-            m = re.match(r"FAIL\s+(.+)", stripped)
+            m = _JEST_FAILURE_RE.match(stripped)
             if m:
                 fid = m.group(1).strip()
 
@@ -410,9 +504,14 @@ def diff_test_failures(
     were extracted at all (e.g. import errors, collection crashes), a single
     sentinel entry is returned in *net_new* to force a hard failure.
     """
-    allowed = set(baseline_ids) | set(known_ids or [])
-    net_new = [fid for fid in current_ids if fid not in allowed]
-    baseline_present = [fid for fid in current_ids if fid in allowed]
+    allowed = set(baseline_ids)
+    if known_ids:
+        allowed.update(known_ids)
+
+    net_new: list[str] = []
+    baseline_present: list[str] = []
+    for fid in current_ids:
+        (baseline_present if fid in allowed else net_new).append(fid)
 
     # STRICT FALLBACK: non-zero exit + no parseable IDs at all → hard fail
     if exit_code_failed and not current_ids:
@@ -421,6 +520,18 @@ def diff_test_failures(
     return net_new, baseline_present
 
 
+# "<n> passed", "<n> failed", "<n> error(s)", "<n> skipped" in a lowercased summary line
+_TEST_COUNT_RE = re.compile(r"(\d+)\s*(passed|failed|error|skipped)")
+
+
+def _first_test_counts(lower: str) -> dict[str, int]:
+    """Return the first count reported for each outcome in a summary line."""
+    counts: dict[str, int] = {}
+    for m in _TEST_COUNT_RE.finditer(lower):
+        counts.setdefault(m.group(2), int(m.group(1)))
+    return counts
+
+
 def parse_test_output(output: str) -> dict[str, Any]:
     """
     Parse test output to extract pass/fail information.
@@ -437,47 +548,38 @@ def parse_test_output(output: str) -> dict[str, Any]:
         "failure_ids": [],
         "all_passed": False,
     }
+    failures = result["failures"]
 
-    import re
-
-    lines = output.split("\n")
-
-    # Common patterns across test frameworks
-    for line in lines:
+    # Common patterns across test frameworks, in one pass over the lines
+    for line in output.split("\n"):
         lower = line.lower()
 
         # pytest style: "5 passed" or "5 passed, 2 failed" or "5 passed in 0.05s"
         if "passed" in lower:
-            passed = re.search(r"(\d+)\s*passed", lower)
-            failed = re.search(r"(\d+)\s*failed", lower)
-            errors = re.search(r"(\d+)\s*error", lower)
-            skipped = re.search(r"(\d+)\s*skipped", lower)
-
-            if passed:
-                result["passed"] = int(passed.group(1))
-            if failed:
-                result["failed"] = int(failed.group(1))
-            if errors:
-                result["failed"] += int(errors.group(1))
-            if skipped:
-                result["skipped"] = int(skipped.group(1))
+            counts = _first_test_counts(lower)
+            if "passed" in counts:
+                result["passed"] = counts["passed"]
+            if "failed" in counts:
+                result["failed"] = counts["failed"]
+            if "error" in counts:
+                result["failed"] += counts["error"]
+            if "skipped" in counts:
+                result["skipped"] = counts["skipped"]
 
         # Jest/mocha style: "Tests: 5 passed, 2 failed"
         elif "tests:" in lower:
-            passed = re.search(r"(\d+)\s*passed", lower)
-            failed = re.search(r"(\d+)\s*failed", lower)
-
-            if passed:
-                result["passed"] = int(passed.group(1))
-            if failed:
-                result["failed"] = int(failed.group(1))
+            counts = _first_test_counts(lower)
+            if "failed" in counts:
+                result["failed"] = counts["failed"]
 
-        # Capture failure messages
-        if "FAILED" in line or "FAIL " in line or "FAIL:" in line or "Error:" in line:
-            result["failures"].append(line.strip())
+        # Capture failure messages ("FAIL" screens out most lines in one check)
+        if (
+            "FAIL" in line and ("FAILED" in line or "FAIL " in line or "FAIL:" in line)
+        ) or "Error:" in line:
+            failures.append(line.strip())
 
     result["total"] = result["passed"] + result["failed"] + result["skipped"]
     result["all_passed"] = result["failed"] == 0 and result["total"] > 0
-    result["failure_ids"] = extract_failure_ids(result["failures"])
+    result["failure_ids"] = extract_failure_ids(failures)
 
     return result
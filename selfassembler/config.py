@@ -60,6 +60,8 @@ class PhaseConfig(BaseModel):
     baseline_enabled: bool = Field(default=True)  # Capture test baseline for diff-based pass/fail
     command_timeout: int = Field(default=300, ge=10)  # Per-command timeout (seconds) for test/lint runs
     soft_fail: bool = Field(default=False)  # Warn instead of fail when errors persist after fix attempts
+    min_diff_lines: int = Field(default=0, ge=0)  # Skip review of PRs changing fewer lines
+    require_scan_on_empty: bool = Field(default=True)  # Run lint checks even if nothing changed vs base
 
 
 class PhasesConfig(BaseModel):
@@ -115,7 +117,9 @@ class PhasesConfig(BaseModel):
         default_factory=lambda: PhaseConfig(timeout=300, max_turns=15, estimated_cost=0.3)
     )
     pr_self_review: PhaseConfig = Field(
-        default_factory=lambda: PhaseConfig(timeout=600, max_turns=20, estimated_cost=0.5)
+        default_factory=lambda: PhaseConfig(
+            timeout=600, max_turns=20, estimated_cost=0.5, min_diff_lines=5
+        )
     )
 
 
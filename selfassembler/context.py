@@ -10,6 +10,11 @@ from typing import Any
 from selfassembler.errors import BudgetExceededError
 
 
+def plans_file(plans_dir: Path, kind: str, task_name: str) -> Path:
+    """Path of a task's plans file, e.g. ``plan-<task>.md`` for kind "plan"."""
+    return plans_dir / f"{kind}-{task_name}.md"
+
+
 @dataclass
 class WorkflowContext:
     """
@@ -57,6 +62,13 @@ class WorkflowContext:
     # Artifacts from phases
     artifacts: dict[str, Any] = field(default_factory=dict)
 
+    # Set mirror of completed_phases for O(1) membership checks; kept in sync
+    # by mark_phase_complete (the list stays the ordered, serialized form)
+    _completed_set: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._completed_set = set(self.completed_phases)
+
     def add_cost(self, phase: str, cost: float) -> None:
         """
         Add cost for a phase and check budget limit.
@@ -84,12 +96,33 @@ class WorkflowContext:
 
     def mark_phase_complete(self, phase: str) -> None:
         """Mark a phase as completed."""
-        if phase not in self.completed_phases:
+        if phase not in self._completed_set:
+            self._completed_set.add(phase)
             self.completed_phases.append(phase)
 
     def is_phase_completed(self, phase: str) -> bool:
         """Check if a phase has been completed."""
-        return phase in self.completed_phases
+        return phase in self._completed_set
+
+    @property
+    def plan_file(self) -> Path:
+        """Path of the implementation plan."""
+        return plans_file(self.plans_dir, "plan", self.task_name)
+
+    @property
+    def research_file(self) -> Path:
+        """Path of the research notes."""
+        return plans_file(self.plans_dir, "research", self.task_name)
+
+    @property
+    def plan_review_file(self) -> Path:
+        """Path of the plan review."""
+        return plans_file(self.plans_dir, "plan-review", self.task_name)
+
+    @property
+    def review_file(self) -> Path:
+        """Path of the code review."""
+        return plans_file(self.plans_dir, "review", self.task_name)
 
     def set_artifact(self, key: str, value: Any) -> None:
         """Store an artifact from a phase."""
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from selfassembler.context import plans_file
+
 
 class DebateFileManager:
     """
@@ -103,8 +105,7 @@ class DebateFileManager:
 
         This matches the standard single-agent output path for backward compatibility.
         """
-        filename = f"{phase}-{self.task_name}.md"
-        return self.plans_dir / filename
+        return plans_file(self.plans_dir, phase, self.task_name)
 
     # -------------------------------------------------------------------------
     # Phase-specific convenience methods
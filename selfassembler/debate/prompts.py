@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from selfassembler.context import plans_file
 from selfassembler.debate.utils import display_name
 
 if TYPE_CHECKING:
@@ -459,7 +460,7 @@ class PlanningDebatePrompts(BaseDebatePromptGenerator):
     phase_name = "planning"
 
     def turn1_primary_prompt(self, output_file: Path) -> str:
-        research_file = self.plans_dir / f"research-{self.task_name}.md"
+        research_file = plans_file(self.plans_dir, "research", self.task_name)
         research_ref = ""
         if research_file.exists():
             research_ref = f"\nReference the research at: {research_file}\n"
@@ -506,7 +507,7 @@ Write your plan to: {output_file}
 """
 
     def turn1_secondary_prompt(self, output_file: Path) -> str:
-        research_file = self.plans_dir / f"research-{self.task_name}.md"
+        research_file = plans_file(self.plans_dir, "research", self.task_name)
         research_ref = ""
         if research_file.exists():
             research_ref = f"\nReference the research at: {research_file}\n"
@@ -554,7 +555,7 @@ class PlanReviewDebatePrompts(BaseDebatePromptGenerator):
     phase_name = "plan_review"
 
     def turn1_primary_prompt(self, output_file: Path) -> str:
-        plan_file = self.plans_dir / f"plan-{self.task_name}.md"
+        plan_file = plans_file(self.plans_dir, "plan", self.task_name)
 
         return f"""# Plan Review Task: {self.task_description}
 
@@ -603,7 +604,7 @@ Format:
 """
 
     def turn1_secondary_prompt(self, output_file: Path) -> str:
-        plan_file = self.plans_dir / f"plan-{self.task_name}.md"
+        plan_file = plans_file(self.plans_dir, "plan", self.task_name)
 
         return f"""# Plan Review Task: {self.task_description}
 
@@ -661,7 +662,8 @@ You are the PRIMARY agent ({self.primary_name}) in a multi-agent workflow.
 
 ## Instructions
 
-1. Get the diff: git diff {self.base_branch}...HEAD
+1. Get the diff, including uncommitted changes: git diff $(git merge-base {self.base_branch} HEAD)
+   New files are untracked and not in the diff; list them with: git status --short
 
 2. Review for:
    - Logic errors or bugs
@@ -710,7 +712,8 @@ You are the SECONDARY agent ({self.secondary_name}) in a multi-agent workflow.
 
 ## Instructions
 
-1. Get the diff: git diff {self.base_branch}...HEAD
+1. Get the diff, including uncommitted changes: git diff $(git merge-base {self.base_branch} HEAD)
+   New files are untracked and not in the diff; list them with: git status --short
 
 2. Review independently for issues the primary reviewer might miss:
    - Logic errors or bugs
@@ -26,6 +26,7 @@ class GitManager:
 
     def __init__(self, repo_path: Path):
         self.repo_path = repo_path
+        self._has_remote: dict[str, bool] = {}  # remote name -> exists
         self._validate_repo()
 
     def _validate_repo(self) -> None:
@@ -70,6 +71,22 @@ class GitManager:
         output = result.stdout.strip()
         return (len(output) == 0, output)
 
+    def get_status(self, cwd: Path | None = None) -> tuple[str, str]:
+        """Get the current branch and porcelain status in one call.
+
+        Returns:
+            Tuple of (branch name, porcelain output). The branch is ``HEAD``
+            when detached, matching ``get_current_branch``.
+        """
+        result = self._run(["status", "--porcelain", "--branch"], cwd=cwd)
+        header, _, output = result.stdout.partition("\n")
+        branch = header.removeprefix("## ").split("...", 1)[0]
+        if branch.startswith(("No commits yet on ", "Initial commit on ")):
+            branch = branch.rsplit(" ", 1)[-1]
+        elif branch.startswith("HEAD (no branch)"):
+            branch = "HEAD"
+        return branch, output.strip()
+
     def ensure_identity(self) -> dict[str, str]:
         """Resolve git identity and export to environment for child processes.
 
@@ -119,13 +136,19 @@ class GitManager:
         _sa_exported_identity = (name, email)
 
     def has_remote(self, remote: str = "origin") -> bool:
-        """Check if a remote exists."""
-        result = self._run(["remote", "get-url", remote], check=False)
-        return result.returncode == 0
+        """Check if a remote exists.
+
+        The answer is remembered for this instance; remove_remote() forgets it.
+        """
+        if remote not in self._has_remote:
+            result = self._run(["remote", "get-url", remote], check=False)
+            self._has_remote[remote] = result.returncode == 0
+        return self._has_remote[remote]
 
     def get_remote_url(self, remote: str = "origin") -> str | None:
         """Get the URL of a remote, or None if it doesn't exist."""
         result = self._run(["remote", "get-url", remote], check=False)
+        self._has_remote[remote] = result.returncode == 0
         if result.returncode != 0:
             return None
         return result.stdout.strip()
@@ -133,6 +156,7 @@ class GitManager:
     def remove_remote(self, remote: str = "origin") -> None:
         """Remove a remote."""
         self._run(["remote", "remove", remote], check=False)
+        self._has_remote.pop(remote, None)
 
     def cleanup_unreachable_remote(self, remote: str = "origin") -> bool:
         """Remove a remote if it points to a local path that doesn't exist.
@@ -314,13 +338,32 @@ class GitManager:
         self,
         base_branch: str = "main",
         cwd: Path | None = None,
+        include_worktree: bool = False,
     ) -> list[str]:
-        """Get list of changed files from base branch."""
-        result = self._run(
-            ["diff", "--name-only", f"{base_branch}...HEAD"],
-            cwd=cwd,
-        )
-        return [f for f in result.stdout.strip().split("\n") if f]
+        """
+        Get list of changed files from base branch.
+
+        Args:
+            base_branch: Branch to compare against
+            cwd: Working directory (default: repo_path)
+            include_worktree: Also include uncommitted and untracked changes,
+                not just commits on HEAD since it forked from base_branch
+
+        Returns:
+            Changed file paths relative to the repository root
+        """
+        if not include_worktree:
+            result = self._run(
+                ["diff", "--name-only", f"{base_branch}...HEAD"],
+                cwd=cwd,
+            )
+            return [f for f in result.stdout.strip().split("\n") if f]
+
+        merge_base = self._run(["merge-base", base_branch, "HEAD"], cwd=cwd).stdout.strip()
+        diff = self._run(["diff", "--name-only", merge_base], cwd=cwd)
+        untracked = self._run(["ls-files", "--others", "--exclude-standard"], cwd=cwd)
+        files = diff.stdout.splitlines() + untracked.stdout.splitlines()
+        return list(dict.fromkeys(f for f in files if f))
 
     def add_files(self, files: list[str], cwd: Path | None = None) -> None:
         """Stage files for commit."""
@@ -339,9 +382,12 @@ class GitManager:
             args.extend(["--author", author])
 
         self._run(args, cwd=cwd)
-        # Get the commit hash
-        hash_result = self._run(["rev-parse", "HEAD"], cwd=cwd)
-        return hash_result.stdout.strip()
+        return self.get_head_sha(cwd=cwd)
+
+    def get_head_sha(self, cwd: Path | None = None) -> str:
+        """Get the commit hash HEAD points to."""
+        result = self._run(["rev-parse", "HEAD"], cwd=cwd)
+        return result.stdout.strip()
 
     def push(
         self,
@@ -411,6 +457,25 @@ class GitManager:
         result = self._run(["rebase", "--continue"], cwd=cwd, check=False)
         return result.returncode == 0
 
+    def restore_worktree(self, cwd: Path | None = None) -> bool:
+        """Discard unstaged changes to tracked files, restoring them from the index.
+
+        Staged changes are kept, so a prior ``git add -A`` acts as a savepoint.
+
+        Returns:
+            True if the files were restored
+        """
+        result = self._run(["checkout", "--", "."], cwd=cwd, check=False)
+        return result.returncode == 0
+
+    def has_unstaged_changes(self, cwd: Path | None = None) -> bool:
+        """Check for changes not yet in the index (edits or new untracked files).
+
+        After a ``git add -A`` savepoint this tells whether anything changed since.
+        """
+        result = self._run(["status", "--porcelain"], cwd=cwd)
+        return any(line[1:2] != " " for line in result.stdout.splitlines())
+
     def stash(self, cwd: Path | None = None, include_untracked: bool = True) -> bool:
         """Stash uncommitted changes.
 
@@ -467,10 +532,41 @@ class GitManager:
             return 0
 
 
+_GLOB_MAGIC_RE = re.compile(r"[*?[]")
+
+
+def find_config_files(source_dir: Path, patterns: list[str]) -> list[Path]:
+    """
+    Find configuration files in a directory.
+
+    Args:
+        source_dir: Directory to search
+        patterns: Glob patterns for files to find
+
+    Literal names are resolved with a single stat instead of a glob, and a
+    file matched by several patterns is only returned once.
+
+    Returns:
+        List of matching file paths
+    """
+    found: dict[Path, None] = {}
+    for pattern in patterns:
+        if _GLOB_MAGIC_RE.search(pattern) is None:
+            src = source_dir / pattern
+            if src.is_file():
+                found[src] = None
+            continue
+        for src in source_dir.glob(pattern):
+            if src.is_file():
+                found[src] = None
+    return list(found)
+
+
 def copy_config_files(
     source_dir: Path,
     dest_dir: Path,
     patterns: list[str],
+    sources: list[Path] | None = None,
 ) -> list[Path]:
     """
     Copy configuration files from source to destination.
@@ -479,19 +575,20 @@ def copy_config_files(
         source_dir: Source directory
         dest_dir: Destination directory
         patterns: Glob patterns for files to copy
+        sources: Files already found by ``find_config_files`` (skips the glob)
 
     Returns:
         List of copied file paths
     """
-    copied = []
+    if sources is None:
+        sources = find_config_files(source_dir, patterns)
 
-    for pattern in patterns:
-        for src in source_dir.glob(pattern):
-            if src.is_file():
-                relative = src.relative_to(source_dir)
-                dst = dest_dir / relative
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
-                copied.append(dst)
+    copied = []
+    for src in sources:
+        relative = src.relative_to(source_dir)
+        dst = dest_dir / relative
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dst)
+        copied.append(dst)
 
     return copied
@@ -313,10 +313,14 @@ Resume with: selfassembler --resume {context.checkpoint_id}
         show_tool_calls: bool = True,
         truncate_length: int = 200,
     ) -> None:
-        """Handle a streaming event from Claude CLI."""
+        """Handle a streaming event from Claude CLI.
+
+        Messages are tagged with the ``stream`` event so webhooks, which
+        only post their configured events, skip per-chunk output.
+        """
         if event.event_type == "tool_use" and show_tool_calls:
             tool_name = event.data.get("name", "unknown")
-            self._send(f"  Using tool: {tool_name}", level="info")
+            self._send(f"  Using tool: {tool_name}", level="info", event="stream")
         elif event.event_type == "assistant":
             # Extract and show truncated text from assistant message
             content = event.data.get("content", "")
@@ -333,12 +337,12 @@ Resume with: selfassembler --resume {context.checkpoint_id}
                     preview += "..."
                 # Only show non-empty previews
                 if preview.strip():
-                    self._send(f"  {preview}", level="info")
+                    self._send(f"  {preview}", level="info", event="stream")
         elif event.event_type == "system":
             # System messages like session start
             message = event.data.get("message", "")
             if message:
-                self._send(f"  {message}", level="info")
+                self._send(f"  {message}", level="info", event="stream")
 
 
 def create_stream_callback(
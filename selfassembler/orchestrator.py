@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import functools
 import json
 import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
 from selfassembler.context import WorkflowContext
 from selfassembler.error_classifier import ErrorOrigin, classify_error
@@ -27,24 +33,228 @@ from selfassembler.notifications import (
     create_notifier_from_config,
     create_stream_callback,
 )
-from selfassembler.phases import PHASE_CLASSES, PHASE_NAMES, Phase, PhaseResult
-from selfassembler.rules import RulesManager
+from selfassembler.phases import PHASE_CLASSES, PHASE_INDEX, PHASE_NAMES, Phase, PhaseResult
 from selfassembler.state import ApprovalStore, CheckpointManager
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
-    from selfassembler.config import WorkflowConfig
+    from selfassembler.config import PhaseConfig, WorkflowConfig
+
+
+# Bound once to skip the attribute lookup on every log() call
+_now = datetime.now
+
+# Separator written before each entry in the text log
+_LOG_SEPARATOR = "\n" + "=" * 80 + "\n"
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+# Pre-encoded '"event":...,"phase":...,"data":' fragments keyed by (event, phase)
+_ENTRY_PREFIXES: dict[tuple[str, str | None], bytes] = {}
+
+
+def _entry_prefix(event: str, phase: str | None) -> bytes:
+    """Return the constant middle of a JSONL entry for an event/phase pair."""
+    key = (event, phase)
+    prefix = _ENTRY_PREFIXES.get(key)
+    if prefix is None:
+        prefix = b'","event":' + _dumps(event) + b',"phase":' + _dumps(phase) + b',"data":'
+        _ENTRY_PREFIXES[key] = prefix
+    return prefix
+
+
+# Banners for _enforce_container_runtime (trailing newline matches print())
+_CONTAINER_ERROR_BANNER = """
+╔══════════════════════════════════════════════════════════════════╗
+║  ERROR: Autonomous mode requires container isolation             ║
+╠══════════════════════════════════════════════════════════════════╣
+║                                                                  ║
+║  Autonomous mode grants Claude full system access, including:    ║
+║  - Execute any shell command                                     ║
+║  - Read/write any file you have access to                        ║
+║  - Make network requests                                         ║
+║                                                                  ║
+║  To protect your system, run inside a Docker container:          ║
+║                                                                  ║
+║    ./run-autonomous.sh /path/to/project "task" task-name         ║
+║                                                                  ║
+║  Or build and run manually:                                      ║
+║                                                                  ║
+║    docker build -t selfassembler .                                ║
+║    docker run -v /project:/workspace selfassembler "task"         ║
+║                                                                  ║
+║  To bypass (NOT RECOMMENDED):                                    ║
+║    export SELFASSEMBLER_ALLOW_HOST_AUTONOMOUS="I_ACCEPT_THE_RISK" ║
+║                                                                  ║
+╚══════════════════════════════════════════════════════════════════╝
+
+"""
+
+_CONTAINER_OVERRIDE_BANNER = """
+⚠️  WARNING: Running autonomous mode on HOST SYSTEM
+⚠️  Claude has full access to your files and system
+⚠️  You accepted this risk via SELFASSEMBLER_ALLOW_HOST_AUTONOMOUS
+
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_container_runtime() -> bool:
+    """Return whether this process runs inside a container.
+
+    The result cannot change during the process lifetime, so the
+    filesystem probes run only once.
+    """
+    # Check 1: Look for /.dockerenv file (Docker)
+    if os.path.exists("/.dockerenv"):
+        return True
+
+    # Check 2: Check cgroup (Docker/Podman)
+    try:
+        with open("/proc/1/cgroup") as f:
+            content = f.read()
+            return "docker" in content or "kubepods" in content
+    except (FileNotFoundError, PermissionError):
+        return False
 
 
 class WorkflowLogger:
-    """Comprehensive logging for workflow debugging."""
+    """Comprehensive logging for workflow debugging.
+
+    Entries are serialized on the calling thread and written to disk by a
+    background writer thread, so logging never blocks the workflow on I/O.
+    The log files and writer are opened on the first entry. Call ``close()``
+    (or ``finalize()``) to drain pending entries; entries logged after that
+    are appended synchronously without keeping the files open.
+    """
+
+    _QUEUE_SIZE = 10000
 
     def __init__(self, log_dir: Path, task_name: str):
         self.log_dir = log_dir
         self.log_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        t = time.localtime()
+        timestamp = (
+            f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+            f"-{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+        )
         self.log_file = log_dir / f"workflow-{task_name}-{timestamp}.log"
         self.json_log_file = log_dir / f"workflow-{task_name}-{timestamp}.jsonl"
-        self._entries: list[dict[str, Any]] = []
+        self._entry_count = 0
+        self._text_fh: IO[str] | None = None
+        self._json_fh: IO[bytes] | None = None
+        self._closed = False
+
+        self._write_lock = threading.Lock()
+        self._queue: queue.Queue[tuple[str, bytes] | None] = queue.Queue(
+            maxsize=self._QUEUE_SIZE
+        )
+        self._writer: threading.Thread | None = None
+
+    def _start(self) -> None:
+        """Open long-lived log handles and start the writer thread.
+
+        Called with ``_write_lock`` held. If the files cannot be opened the
+        writer is not started and entries are written synchronously.
+        """
+        try:
+            self._text_fh = open(self.log_file, "a", buffering=1)  # noqa: SIM115
+            self._json_fh = open(self.json_log_file, "ab")  # noqa: SIM115
+        except OSError:
+            if self._text_fh is not None:
+                self._text_fh.close()
+            self._text_fh = None
+            return
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="workflow-logger", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)  # Drain pending entries on interpreter exit
+
+    def _writer_loop(self) -> None:
+        """Write queued entries until the ``None`` sentinel is received."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            self._write(*item)
+
+    def _write(self, text: str, json_line: bytes) -> None:
+        """Write one serialized entry to both log files."""
+        with self._write_lock:
+            try:
+                if self._text_fh is None or self._json_fh is None:
+                    # Closed (or never opened): append without keeping handles
+                    with open(self.log_file, "a") as text_fh:
+                        text_fh.write(text)
+                    with open(self.json_log_file, "ab") as json_fh:
+                        json_fh.write(json_line)
+                    return
+                self._text_fh.write(text)
+                self._json_fh.write(json_line)
+                self._json_fh.flush()
+            except OSError:
+                pass  # Don't fail workflow on logging errors (e.g. disk full)
+
+    def _serialize(
+        self,
+        event: str,
+        phase: str | None,
+        data: dict[str, Any] | None,
+        output: str | None,
+    ) -> tuple[str, bytes]:
+        """Render one event as a (text log entry, JSONL line) pair."""
+        timestamp = _now().isoformat()
+        # Only the timestamp, data and output vary; the rest is pre-encoded
+        json_line = b"".join(
+            (
+                b'{"timestamp":"',
+                timestamp.encode(),
+                _entry_prefix(event, phase),
+                _dumps(data) if data else b"{}",
+            )
+        )
+        if output:
+            # Truncate very long outputs (slicing copies, so only when needed)
+            json_line += b',"output":' + _dumps(output if len(output) <= 10000 else output[:10000])
+        json_line += b"}\n"
+
+        self._entry_count += 1
+
+        # Text log entry, assembled for a single write
+        parts = [_LOG_SEPARATOR, f"[{timestamp}] {event}"]
+        if phase:
+            parts.append(f" (phase: {phase})")
+        parts.append("\n")
+        if data:
+            parts.extend(f"  {k}: {v}\n" for k, v in data.items())
+        if output:
+            parts.append(f"\n--- Output ---\n{output}\n--- End Output ---\n")
+        return "".join(parts), json_line
+
+    def _submit(self, item: tuple[str, bytes]) -> None:
+        """Hand a serialized item to the writer thread, or write it inline."""
+        if self._writer is None and not self._closed:
+            with self._write_lock:
+                if self._writer is None and not self._closed:
+                    self._start()
+        if self._writer is not None and self._writer.is_alive():
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                pass  # Writer is backed up; write synchronously instead
+        self._write(*item)
 
     def log(
         self,
@@ -54,33 +264,21 @@ class WorkflowLogger:
         output: str | None = None,
     ) -> None:
         """Log an event with optional data and output."""
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "event": event,
-            "phase": phase,
-            "data": data or {},
-        }
-        if output:
-            entry["output"] = output[:10000]  # Truncate very long outputs
-
-        self._entries.append(entry)
-
-        # Write to text log
-        with open(self.log_file, "a") as f:
-            f.write(f"\n{'=' * 80}\n")
-            f.write(f"[{entry['timestamp']}] {event}")
-            if phase:
-                f.write(f" (phase: {phase})")
-            f.write("\n")
-            if data:
-                for k, v in data.items():
-                    f.write(f"  {k}: {v}\n")
-            if output:
-                f.write(f"\n--- Output ---\n{output}\n--- End Output ---\n")
-
-        # Write to JSON log
-        with open(self.json_log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        self._submit(self._serialize(event, phase, data, output))
+
+    def log_batch(self, entries: list[dict[str, Any]]) -> None:
+        """Log several events as one write.
+
+        Each entry is a dict of ``log()`` keyword arguments (``event`` is
+        required; ``phase``, ``data`` and ``output`` are optional).
+        """
+        if not entries:
+            return
+        items = [
+            self._serialize(e["event"], e.get("phase"), e.get("data"), e.get("output"))
+            for e in entries
+        ]
+        self._submit(("".join(t for t, _ in items), b"".join(j for _, j in items)))
 
     def log_command(self, command: str | list, cwd: Path | None, phase: str | None = None) -> None:
         """Log a command execution."""
@@ -99,21 +297,39 @@ class WorkflowLogger:
         result: Any = None,
     ) -> None:
         """Log a Claude CLI invocation."""
+        preview = prompt if len(prompt) <= 500 else f"{prompt[:500]}..."
+        output = None if not result else result if isinstance(result, str) else str(result)
         self.log(
             "claude_invocation",
             phase=phase,
             data={
                 "working_dir": str(working_dir),
-                "prompt_preview": prompt[:500] + "..." if len(prompt) > 500 else prompt,
+                "prompt_preview": preview,
             },
-            output=str(result) if result else None,
+            output=output,
         )
 
     def finalize(self) -> Path:
         """Finalize and return the log file path."""
-        self.log("workflow_log_finalized", data={"total_entries": len(self._entries)})
+        self.log("workflow_log_finalized", data={"total_entries": self._entry_count})
+        self.close()
         return self.log_file
 
+    def close(self) -> None:
+        """Drain pending entries, stop the writer and close the log files."""
+        with self._write_lock:
+            self._closed = True
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        atexit.unregister(self.close)
+        with self._write_lock:
+            for fh in (self._text_fh, self._json_fh):
+                if fh is not None:
+                    with contextlib.suppress(OSError):
+                        fh.close()
+            self._text_fh = self._json_fh = None
+
 
 class Orchestrator:
     """
@@ -140,6 +356,9 @@ class Orchestrator:
     ):
         self.context = context
         self.config = config
+        self._rebind_config()
+        # (name, class) pairs resolved once for the phase dispatch loop
+        self._phase_table = [(cls.name, cls) for cls in self.PHASES]
         self.notifier = notifier or create_notifier_from_config(config.to_dict())
 
         # Initialize workflow logger
@@ -182,9 +401,32 @@ class Orchestrator:
         if config.autonomous_mode:
             self._enforce_container_runtime()
 
+    def _rebind_config(self) -> None:
+        """Bind frequently read config subtrees and values to plain attributes.
+
+        Must be called again after mutating ``self.config`` (e.g. CLI
+        overrides applied on resume) so the cached values stay in sync.
+        """
+        config = self.config
+        self._cfg_approvals = config.approvals
+        self._cfg_fallback = config.fallback
+        self._cfg_git = config.git
+        self._approvals_enabled = config.approvals.enabled
+        self._approvals_timeout_hours = config.approvals.timeout_hours
+        self._max_fallback_attempts = config.fallback.max_fallback_attempts
+        self._cleanup_remote_on_fail = config.git.cleanup_remote_on_fail
+        self._debug_logging = bool(config.streaming.debug)
+        self._agent_config = config.get_effective_agent_config()
+        # Streaming options shared by every executor this orchestrator creates
+        self._stream_kwargs: dict[str, Any] = {
+            "stream": config.streaming.enabled,
+            "verbose": config.streaming.verbose,
+            "debug": config.streaming.debug,
+        }
+
     def _create_executor(self, working_dir: Path) -> AgentExecutor:
         """Create a new agent executor for the given working directory."""
-        agent_config = self.config.get_effective_agent_config()
+        agent_config = self._agent_config
         self.logger.log(
             "executor_created",
             data={
@@ -197,10 +439,8 @@ class Orchestrator:
             working_dir=working_dir,
             default_timeout=agent_config.default_timeout,
             model=agent_config.model,
-            stream=self.config.streaming.enabled,
             stream_callback=self._stream_callback,
-            verbose=self.config.streaming.verbose,
-            debug=self.config.streaming.debug,
+            **self._stream_kwargs,
         )
 
     def _create_secondary_executor(self, working_dir: Path) -> AgentExecutor:
@@ -221,10 +461,8 @@ class Orchestrator:
             working_dir=working_dir,
             default_timeout=debate_config.turn_timeout_seconds,
             model=None,  # Use default model for secondary agent
-            stream=self.config.streaming.enabled,
             stream_callback=self._stream_callback,
-            verbose=self.config.streaming.verbose,
-            debug=self.config.streaming.debug,
+            **self._stream_kwargs,
         )
 
     def _create_fallback_executor(self, working_dir: Path) -> AgentExecutor | None:
@@ -237,9 +475,9 @@ class Orchestrator:
         """
         from selfassembler.executors import detect_installed_agents
 
-        agent_config = self.config.get_effective_agent_config()
+        agent_config = self._agent_config
         primary_type = agent_config.type
-        fallback_type = self.config.fallback.fallback_agent
+        fallback_type = self._cfg_fallback.fallback_agent
 
         if fallback_type is None:
             # Auto-detect: pick a different installed agent
@@ -273,10 +511,8 @@ class Orchestrator:
             working_dir=working_dir,
             default_timeout=agent_config.default_timeout,
             model=None,  # Use default model for fallback agent
-            stream=self.config.streaming.enabled,
             stream_callback=self._stream_callback,
-            verbose=self.config.streaming.verbose,
-            debug=self.config.streaming.debug,
+            **self._stream_kwargs,
         )
 
     def _reinitialize_executor_for_worktree(self) -> None:
@@ -362,6 +598,8 @@ class Orchestrator:
         if not self.context.worktree_path or not self.context.worktree_path.exists():
             return
 
+        from selfassembler.rules import RulesManager
+
         rules_manager = RulesManager(
             enabled_rules=self.config.rules.enabled_rules,
             custom_rules=self.config.rules.custom_rules,
@@ -382,60 +620,18 @@ class Orchestrator:
 
     def _enforce_container_runtime(self) -> None:
         """Refuse to run autonomous mode outside a container."""
-        # Check 1: Look for /.dockerenv file (Docker)
-        in_docker = os.path.exists("/.dockerenv")
-
-        # Check 2: Check cgroup (Docker/Podman)
-        in_cgroup = False
-        try:
-            with open("/proc/1/cgroup") as f:
-                content = f.read()
-                in_cgroup = "docker" in content or "kubepods" in content
-        except (FileNotFoundError, PermissionError):
-            pass
+        # Checks 1-2: Filesystem container markers (cached per process)
+        in_container = _detect_container_runtime()
 
         # Check 3: Environment variable override (for testing)
         override = os.environ.get("SELFASSEMBLER_ALLOW_HOST_AUTONOMOUS") == "I_ACCEPT_THE_RISK"
 
-        if not (in_docker or in_cgroup or override):
-            print(
-                """
-╔══════════════════════════════════════════════════════════════════╗
-║  ERROR: Autonomous mode requires container isolation             ║
-╠══════════════════════════════════════════════════════════════════╣
-║                                                                  ║
-║  Autonomous mode grants Claude full system access, including:    ║
-║  - Execute any shell command                                     ║
-║  - Read/write any file you have access to                        ║
-║  - Make network requests                                         ║
-║                                                                  ║
-║  To protect your system, run inside a Docker container:          ║
-║                                                                  ║
-║    ./run-autonomous.sh /path/to/project "task" task-name         ║
-║                                                                  ║
-║  Or build and run manually:                                      ║
-║                                                                  ║
-║    docker build -t selfassembler .                                ║
-║    docker run -v /project:/workspace selfassembler "task"         ║
-║                                                                  ║
-║  To bypass (NOT RECOMMENDED):                                    ║
-║    export SELFASSEMBLER_ALLOW_HOST_AUTONOMOUS="I_ACCEPT_THE_RISK" ║
-║                                                                  ║
-╚══════════════════════════════════════════════════════════════════╝
-""",
-                file=sys.stderr,
-            )
+        if not (in_container or override):
+            sys.stderr.write(_CONTAINER_ERROR_BANNER)
             raise ContainerRequiredError()
 
         if override:
-            print(
-                """
-⚠️  WARNING: Running autonomous mode on HOST SYSTEM
-⚠️  Claude has full access to your files and system
-⚠️  You accepted this risk via SELFASSEMBLER_ALLOW_HOST_AUTONOMOUS
-""",
-                file=sys.stderr,
-            )
+            sys.stderr.write(_CONTAINER_OVERRIDE_BANNER)
 
     def run_workflow(self, skip_to: str | None = None) -> WorkflowContext:
         """
@@ -459,37 +655,34 @@ class Orchestrator:
         start_index = 0
         if skip_to:
             try:
-                start_index = PHASE_NAMES.index(skip_to)
-            except ValueError:
+                start_index = PHASE_INDEX[skip_to]
+            except KeyError:
                 raise ValueError(f"Unknown phase: {skip_to}. Valid phases: {PHASE_NAMES}") from None
 
         try:
-            for i, phase_class in enumerate(self.PHASES):
-                # Skip phases until we reach the starting phase
-                if i < start_index:
-                    self.logger.log(
-                        "phase_skipped",
-                        phase=phase_class.name,
-                        data={"reason": "skip_to"},
-                    )
-                    continue
+            # Phases before the starting phase are skipped; log them in one batch
+            self.logger.log_batch([
+                {"event": "phase_skipped", "phase": name, "data": {"reason": "skip_to"}}
+                for name, _ in self._phase_table[:start_index]
+            ])
 
+            for name, phase_class in self._phase_table[start_index:]:
                 # Skip disabled phases
-                phase_config = self.config.get_phase_config(phase_class.name)
+                phase_config = self.config.get_phase_config(name)
                 if not phase_config.enabled:
                     self.logger.log(
                         "phase_skipped",
-                        phase=phase_class.name,
+                        phase=name,
                         data={"reason": "disabled"},
                     )
                     continue
 
                 # Create and run phase
                 phase = self._create_phase(phase_class)
-                self._run_phase(phase)
+                self._run_phase(phase, phase_config)
 
                 # After setup phase, reinitialize executor for worktree and write rules
-                if phase_class.name == "setup" and self.context.worktree_path:
+                if name == "setup" and self.context.worktree_path:
                     self._reinitialize_executor_for_worktree()
                     self._write_rules_to_worktree()
 
@@ -521,7 +714,7 @@ class Orchestrator:
             )
 
             # Only cleanup if explicitly configured AND safe to do so
-            if self.config.git.cleanup_on_fail and self._can_cleanup_safely():
+            if self._cfg_git.cleanup_on_fail and self._can_cleanup_safely():
                 self.cleanup(reason=str(e))
 
             log_file = self.logger.finalize()
@@ -554,10 +747,16 @@ class Orchestrator:
         "conflict_check",
     })
 
-    def _run_phase(self, phase: Phase) -> PhaseResult:
-        """Run a single phase with all the orchestration logic."""
+    def _run_phase(self, phase: Phase, phase_config: PhaseConfig | None = None) -> PhaseResult:
+        """Run a single phase with all the orchestration logic.
+
+        Args:
+            phase: The phase to run
+            phase_config: The phase's config, if the caller already looked it up
+        """
         phase_name = phase.name
-        phase_config = self.config.get_phase_config(phase_name)
+        if phase_config is None:
+            phase_config = self.config.get_phase_config(phase_name)
         max_retries = phase_config.max_retries
 
         self.logger.log(
@@ -619,6 +818,8 @@ class Orchestrator:
                 )
             last_result = result
 
+            # Full artifact dumps can be large; only render them when debugging
+            artifacts = result.artifacts
             self.logger.log(
                 "phase_attempt_complete",
                 phase=phase_name,
@@ -628,8 +829,9 @@ class Orchestrator:
                     "cost_usd": result.cost_usd,
                     "error": result.error[:500] if result.error else None,
                     "failure_category": str(result.failure_category) if result.failure_category else None,
+                    "artifact_keys": list(artifacts) if artifacts else None,
                 },
-                output=str(result.artifacts) if result.artifacts else None,
+                output=str(artifacts) if artifacts and self._debug_logging else None,
             )
 
             # Check for budget warning
@@ -743,7 +945,7 @@ class Orchestrator:
             return True
 
         # Check trigger mode
-        if self.config.fallback.trigger == "all_errors":
+        if self._cfg_fallback.trigger == "all_errors":
             return True
 
         # "agent_errors" mode: classify the error text
@@ -764,7 +966,7 @@ class Orchestrator:
 
         fallback_type = getattr(self.fallback_executor, "AGENT_TYPE", "unknown")
         primary_type = getattr(self.executor, "AGENT_TYPE", "unknown")
-        max_attempts = self.config.fallback.max_fallback_attempts
+        max_attempts = self._max_fallback_attempts
 
         self.logger.log(
             "fallback_attempting",
@@ -840,11 +1042,11 @@ class Orchestrator:
 
     def _needs_approval(self, phase: Phase) -> bool:
         """Check if phase requires approval."""
-        if not self.config.approvals.enabled:
+        if not self._approvals_enabled:
             return False
 
         # Check if this specific phase has an approval gate configured
-        gates = self.config.approvals.gates
+        gates = self._cfg_approvals.gates
         phase_name_normalized = phase.name.replace("-", "_")
         gate_config = getattr(gates, phase_name_normalized, None)
         if gate_config is True:
@@ -864,11 +1066,11 @@ class Orchestrator:
         # Wait for approval file
         approved = self.approval_store.wait_for_approval(
             phase_name,
-            timeout_hours=self.config.approvals.timeout_hours,
+            timeout_hours=self._approvals_timeout_hours,
         )
 
         if not approved:
-            raise ApprovalTimeoutError(phase_name, self.config.approvals.timeout_hours)
+            raise ApprovalTimeoutError(phase_name, self._approvals_timeout_hours)
 
     def _checkpoint(self) -> None:
         """Create a checkpoint of the current state."""
@@ -896,7 +1098,7 @@ class Orchestrator:
 
         # Remove remote branch if configured and pushed
         if (
-            self.config.git.cleanup_remote_on_fail
+            self._cleanup_remote_on_fail
             and self.context.branch_pushed
             and self.context.branch_name
         ):
@@ -952,7 +1154,7 @@ class Orchestrator:
         # Find the first incomplete phase
         skip_to = None
         for phase_name in PHASE_NAMES:
-            if phase_name not in self.context.completed_phases:
+            if not self.context.is_phase_completed(phase_name):
                 skip_to = phase_name
                 break
 
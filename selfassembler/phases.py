@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
+import hashlib
+import os
 import re
+import shutil
 import subprocess
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -16,9 +22,11 @@ from selfassembler.commands import (
     load_known_failures,
     parse_test_output,
     run_command,
+    scope_command_to_files,
 )
-from selfassembler.errors import PreflightFailedError
-from selfassembler.git import GitManager, copy_config_files
+from selfassembler.errors import FailureCategory, PreflightFailedError
+from selfassembler.git import GitManager, copy_config_files, find_config_files
+from selfassembler.state import StateStore
 
 if TYPE_CHECKING:
     from selfassembler.config import DebateConfig, WorkflowConfig
@@ -26,7 +34,88 @@ if TYPE_CHECKING:
     from selfassembler.executors import AgentExecutor
 
 
-@dataclass
+# Config file names copied into the worktree, in lookup order
+_SELFASSEMBLER_CONFIG_NAMES = (
+    "selfassembler.yaml",
+    "selfassembler.yml",
+    ".selfassembler.yaml",
+    ".selfassembler.yml",
+)
+
+# Error location at the start of a lint/typecheck output line:
+#   mypy: "file.py:42: error: Something [code]"
+#   ruff: "file.py:42:10: E501 ..."
+#   eslint: "/path/file.js  42:10  error  ..."
+_ERROR_LOCATION_RE = re.compile(r"(\S+?:\d+(?::\d+)?)\s*[:\s]")
+
+_NO_ERRORS: frozenset[str] = frozenset()
+
+# Very verbose tool output is only scanned this far for error locations
+_MAX_PARSE_CHARS = 256 * 1024
+
+# Output kept per lint/typecheck iteration (and failed test run) in the phase results
+_MAX_RESULT_OUTPUT_CHARS = 8 * 1024
+
+# GitHub pull request URL, as printed by `gh pr create`
+_PR_URL_RE = re.compile(r"https://github\.com/[^/]+/[^/]+/pull/(\d+)")
+
+# PR diffs up to this size are embedded in the self-review prompt
+_MAX_INLINE_DIFF_CHARS = 32 * 1024
+
+# Tools that make a phase need "acceptEdits" (see Phase._get_permission_mode)
+_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+# How long a passed CLI probe is reused before it is run again
+PREFLIGHT_CACHE_TTL_SECONDS = 300
+
+# How long a stored test baseline is reused for the same HEAD and test command.
+# Bounded so a baseline captured in a broken environment doesn't mask
+# failures indefinitely.
+BASELINE_CACHE_TTL_SECONDS = 3600
+
+
+def _probe_cache_key(binary: str) -> str | None:
+    """Key a CLI probe on the resolved binary, its mtime and PATH.
+
+    Returns None when the binary cannot be resolved, which disables caching.
+    """
+    path = shutil.which(binary)
+    if path is None:
+        return None
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    path_hash = hashlib.sha256(os.environ.get("PATH", "").encode()).hexdigest()[:16]
+    return f"{path}:{mtime}:{path_hash}"
+
+
+def _gh_credential_helper_configured() -> bool:
+    """Check whether ``gh auth setup-git`` has already configured git for github.com."""
+    try:
+        result = subprocess.run(
+            ["git", "config", "--global", "--get-all", "credential.https://github.com.helper"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except Exception:
+        return False
+    return "gh auth git-credential" in result.stdout
+
+
+def _count_changed_lines(diff: str, limit: int) -> int:
+    """Count added/removed lines in a unified diff, stopping once ``limit`` is reached."""
+    count = 0
+    for line in diff.splitlines():
+        if count >= limit:
+            break
+        if line[:1] in ("+", "-") and not line.startswith(("+++ ", "--- ")):
+            count += 1
+    return count
+
+
+@dataclass(slots=True)
 class PhaseResult:
     """Result from executing a phase."""
 
@@ -81,10 +170,26 @@ class Phase(ABC):
         """Get the configuration for this phase."""
         return self.config.get_phase_config(self.name)
 
+    def _restore_savepoint(self, workdir: Path) -> None:
+        """Drop unstaged edits from a failed fix attempt, keeping the staged savepoint."""
+        with contextlib.suppress(Exception):
+            GitManager(workdir).restore_worktree()
+
+    def _changed_since_savepoint(self, workdir: Path) -> bool:
+        """Whether a fix attempt changed anything since the staged savepoint.
+
+        Assumes it did when git cannot tell.
+        """
+        try:
+            return GitManager(workdir).has_unstaged_changes()
+        except Exception:
+            return True
+
     def _dangerous_mode(self) -> bool:
         """Return whether to skip permissions in autonomous mode."""
-        effective_config = self.config.get_effective_agent_config()
-        return self.config.autonomous_mode and effective_config.dangerous_mode
+        if not self.config.autonomous_mode:
+            return False
+        return self.config.get_effective_agent_config().dangerous_mode
 
     def _get_permission_mode(self) -> str | None:
         """
@@ -103,8 +208,6 @@ class Phase(ABC):
         for read-only operations (e.g., CodeReviewPhase uses git diff). Phases that
         need Bash for writing should set requires_write = True.
         """
-        import os
-
         # Environment override (e.g., Docker sandbox where container = isolation)
         env_mode = os.environ.get("SA_PERMISSION_MODE")
         if env_mode:
@@ -116,8 +219,7 @@ class Phase(ABC):
 
         # Check if this phase needs file write access - takes priority over claude_mode
         # because Codex "suggest" mode is fully read-only unlike Claude's "plan" mode
-        write_tools = {"Write", "Edit"}
-        if self.allowed_tools and write_tools & set(self.allowed_tools):
+        if self.allowed_tools and not _WRITE_TOOLS.isdisjoint(self.allowed_tools):
             return "acceptEdits"
 
         if self.claude_mode is not None:
@@ -137,6 +239,11 @@ class DebatePhase(Phase):
 
     debate_supported: bool = True
     debate_phase_name: str = "base"  # Used for prompt generator lookup
+    _debate_phase_key: str = "base"  # DebatePhasesConfig field name
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._debate_phase_key = cls.debate_phase_name.replace("-", "_")
 
     def __init__(
         self,
@@ -150,10 +257,17 @@ class DebatePhase(Phase):
 
     def run(self) -> PhaseResult:
         """Execute the phase, optionally with debate."""
+        skip_reason = self._skip_reason()
+        if skip_reason:
+            return PhaseResult(success=True, artifacts={"skipped": skip_reason})
         if self._should_debate():
             return self._run_with_debate()
         return self._run_single_agent()
 
+    def _skip_reason(self) -> str | None:
+        """Return why this phase has nothing to do, checked once for both modes."""
+        return None
+
     def _should_debate(self) -> bool:
         """Check if debate should be used for this phase."""
         debate_config = self.config.debate
@@ -164,8 +278,7 @@ class DebatePhase(Phase):
             return False
 
         # Check if this specific phase has debate enabled
-        phase_key = self.debate_phase_name.replace("-", "_")
-        return getattr(debate_config.phases, phase_key, False)
+        return getattr(debate_config.phases, self._debate_phase_key, False)
 
     def _run_with_debate(self) -> PhaseResult:
         """Run the phase with multi-agent debate."""
@@ -244,22 +357,17 @@ class PreflightPhase(Phase):
     timeout_seconds = 60
 
     def run(self) -> PhaseResult:
-        # Remove unreachable local-path origins before running checks.
-        # This handles repos cloned from a local path that are now running
-        # inside a container where the original path doesn't exist.
-        try:
-            git = GitManager(self.context.repo_path)
-            git.cleanup_unreachable_remote()
-        except Exception:
-            pass  # Best-effort; individual checks will report git issues
-
-        checks = [
-            self._check_agent_cli(),
-            self._check_gh_cli(),
-            self._check_git_identity(),
-            self._check_git_clean(),
-            self._check_git_updated(),
-        ]
+        # The agent CLI probe is independent of the repo, so run it alongside
+        # the rest. The gh probe must finish first: `gh auth setup-git`
+        # installs the credential helper the fetch in _check_git_updated
+        # needs. The git checks stay sequential: checkout/pull in
+        # _check_git_updated must not race the is_clean check.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            agent_future = pool.submit(self._check_agent_cli)
+            gh_check = self._check_gh_cli()
+            git_checks = self._run_git_checks()
+
+            checks = [agent_future.result(), gh_check, *git_checks]
 
         failed = [c for c in checks if not c["passed"]]
         if failed:
@@ -268,8 +376,76 @@ class PreflightPhase(Phase):
 
         return PhaseResult(success=True, artifacts={"checks": checks})
 
+    def _run_git_checks(self) -> list[dict[str, Any]]:
+        """Run the repository checks in order.
+
+        The unreachable-remote cleanup runs here rather than up front so it
+        overlaps the agent CLI probe; it still precedes the fetch in
+        ``_check_git_updated``. Branch and working tree state come from a
+        single ``git status``; if that fails the checks query git themselves
+        and report the error.
+        """
+        status: tuple[str, str] | None = None
+        try:
+            git = GitManager(self.context.repo_path)
+        except Exception:
+            git = None  # Individual checks will report git issues
+
+        if git is not None:
+            # Remove unreachable local-path origins before running checks.
+            # This handles repos cloned from a local path that are now running
+            # inside a container where the original path doesn't exist.
+            with contextlib.suppress(Exception):
+                git.cleanup_unreachable_remote()
+            with contextlib.suppress(Exception):
+                status = git.get_status()
+
+        return [
+            self._check_git_identity(),
+            self._check_git_clean(status),
+            self._check_git_updated(status[0] if status else None),
+        ]
+
+    def _cached_probe(
+        self, binary: str | None, probe: Callable[[], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Run a CLI probe, reusing a recent passing result for the same binary.
+
+        Only passed results are stored, so a failure is always re-checked.
+        Cache entries of an unexpected shape are ignored.
+        """
+        key = _probe_cache_key(binary) if isinstance(binary, str) and binary else None
+        if key is None:
+            return probe()
+
+        store = StateStore()
+        store_key = f"preflight-{binary}"
+        cached = store.load(store_key)
+        if isinstance(cached, dict) and cached.get("key") == key:
+            checked_at = cached.get("checked_at")
+            cached_result = cached.get("result")
+            if (
+                isinstance(checked_at, (int, float))
+                and time.time() - checked_at < PREFLIGHT_CACHE_TTL_SECONDS
+                and isinstance(cached_result, dict)
+                and cached_result.get("passed") is True
+            ):
+                return cached_result
+
+        result = probe()
+        if result["passed"]:
+            with contextlib.suppress(OSError):
+                store.save(store_key, {"key": key, "checked_at": time.time(), "result": result})
+        return result
+
     def _check_agent_cli(self) -> dict[str, Any]:
         """Check if the configured agent CLI is installed."""
+        return self._cached_probe(
+            getattr(self.executor, "CLI_COMMAND", None), self._probe_agent_cli
+        )
+
+    def _probe_agent_cli(self) -> dict[str, Any]:
+        """Run the agent CLI availability check."""
         try:
             is_available, version_or_error = self.executor.check_available()
             agent_type = getattr(self.executor, "AGENT_TYPE", "unknown")
@@ -292,7 +468,11 @@ class PreflightPhase(Phase):
             return {"name": "agent_cli", "passed": False, "message": str(e)}
 
     def _check_gh_cli(self) -> dict[str, Any]:
-        """Check if GitHub CLI is authenticated and configure git credentials."""
+        """Check if GitHub CLI is authenticated and configure git credentials.
+
+        Not cached: auth can be revoked or switched (``GH_TOKEN``, ``GH_HOST``)
+        between runs, and a stale pass would only surface at pr_creation.
+        """
         try:
             result = subprocess.run(
                 ["gh", "auth", "status"],
@@ -301,12 +481,14 @@ class PreflightPhase(Phase):
                 timeout=10,
             )
             if result.returncode == 0:
-                # Configure git to use gh as credential helper
-                subprocess.run(
-                    ["gh", "auth", "setup-git"],
-                    capture_output=True,
-                    timeout=10,
-                )
+                # Configure git to use gh as credential helper (skipping the
+                # second gh launch when a previous run already did)
+                if not _gh_credential_helper_configured():
+                    subprocess.run(
+                        ["gh", "auth", "setup-git"],
+                        capture_output=True,
+                        timeout=10,
+                    )
                 return {"name": "gh_cli", "passed": True}
             return {
                 "name": "gh_cli",
@@ -337,11 +519,19 @@ class PreflightPhase(Phase):
         except Exception as e:
             return {"name": "git_identity", "passed": False, "message": str(e)}
 
-    def _check_git_clean(self) -> dict[str, Any]:
-        """Check if git working directory is clean."""
+    def _check_git_clean(self, status: tuple[str, str] | None = None) -> dict[str, Any]:
+        """Check if git working directory is clean.
+
+        Args:
+            status: Result of ``GitManager.get_status()``, if already known
+        """
         try:
-            git = GitManager(self.context.repo_path)
-            is_clean, output = git.is_clean()
+            if status is None:
+                git = GitManager(self.context.repo_path)
+                is_clean, output = git.is_clean()
+            else:
+                output = status[1]
+                is_clean = not output
             if is_clean:
                 return {"name": "git_clean", "passed": True}
             return {
@@ -352,12 +542,15 @@ class PreflightPhase(Phase):
         except Exception as e:
             return {"name": "git_clean", "passed": False, "message": str(e)}
 
-    def _check_git_updated(self) -> dict[str, Any]:
+    def _check_git_updated(self, current_branch: str | None = None) -> dict[str, Any]:
         """Check if local branch is up to date with remote.
 
         If auto_update is enabled, this will:
         1. Checkout the base branch if not already on it
         2. Pull latest changes if behind
+
+        Args:
+            current_branch: The checked-out branch, if already known
         """
         try:
             git = GitManager(self.context.repo_path)
@@ -365,7 +558,8 @@ class PreflightPhase(Phase):
             auto_update = self.config.git.auto_update
 
             # First, check current branch and optionally checkout base branch
-            current_branch = git.get_current_branch()
+            if current_branch is None:
+                current_branch = git.get_current_branch()
             if current_branch != base_branch and auto_update:
                 try:
                     git.checkout(base_branch)
@@ -426,27 +620,27 @@ class SetupPhase(Phase):
                 # Resolve relative path from repo_path
                 worktree_dir = (self.context.repo_path / worktree_dir).resolve()
 
-            worktree_path = git.create_worktree(
-                branch_name=branch_name,
-                worktree_dir=worktree_dir,
-                base_branch=self.config.git.base_branch,
-            )
+            # Find the files to copy while git creates the worktree
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+                sources_future = pool.submit(self._find_config_sources)
+                worktree_path = git.create_worktree(
+                    branch_name=branch_name,
+                    worktree_dir=worktree_dir,
+                    base_branch=self.config.git.base_branch,
+                )
+                sources, config_name = sources_future.result()
 
             # Copy config files
             copied = copy_config_files(
                 source_dir=self.context.repo_path,
                 dest_dir=worktree_path,
                 patterns=self.config.copy_files,
+                sources=sources,
             )
 
             # Copy selfassembler.yaml to worktree so config is found on resume
-            import shutil
-            for config_name in ("selfassembler.yaml", "selfassembler.yml",
-                                ".selfassembler.yaml", ".selfassembler.yml"):
-                config_src = self.context.repo_path / config_name
-                if config_src.exists():
-                    shutil.copy2(config_src, worktree_path / config_name)
-                    break
+            if config_name:
+                shutil.copy2(self.context.repo_path / config_name, worktree_path / config_name)
 
             # Update context
             self.context.worktree_path = worktree_path
@@ -463,6 +657,15 @@ class SetupPhase(Phase):
         except Exception as e:
             return PhaseResult(success=False, error=str(e))
 
+    def _find_config_sources(self) -> tuple[list[Path], str | None]:
+        """Find config files to copy and the selfassembler config, if any."""
+        sources = find_config_files(self.context.repo_path, self.config.copy_files)
+        # One directory read instead of a stat per candidate name
+        with os.scandir(self.context.repo_path) as entries:
+            names = {entry.name for entry in entries}
+        config_name = next((n for n in _SELFASSEMBLER_CONFIG_NAMES if n in names), None)
+        return sources, config_name
+
 
 class ResearchPhase(DebatePhase):
     """Gather context before planning."""
@@ -476,7 +679,7 @@ class ResearchPhase(DebatePhase):
     fresh_context = True  # Unbiased research
 
     def _run_single_agent(self) -> PhaseResult:
-        research_file = self.context.plans_dir / f"research-{self.context.task_name}.md"
+        research_file = self.context.research_file
         self.context.plans_dir.mkdir(parents=True, exist_ok=True)
 
         prompt = f"""
@@ -536,8 +739,8 @@ class PlanningPhase(DebatePhase):
     approval_gate = True  # Configurable via config
 
     def _run_single_agent(self) -> PhaseResult:
-        plan_file = self.context.plans_dir / f"plan-{self.context.task_name}.md"
-        research_file = self.context.plans_dir / f"research-{self.context.task_name}.md"
+        plan_file = self.context.plan_file
+        research_file = self.context.research_file
 
         research_ref = ""
         if research_file.exists():
@@ -609,15 +812,14 @@ class PlanReviewPhase(DebatePhase):
     timeout_seconds = 600
     approval_gate = False  # Configurable via --review-plan-approval
 
-    def _run_single_agent(self) -> PhaseResult:
-        plan_file = self.context.plans_dir / f"plan-{self.context.task_name}.md"
-        review_file = self.context.plans_dir / f"plan-review-{self.context.task_name}.md"
+    def _skip_reason(self) -> str | None:
+        if not self.context.plan_file.exists():
+            return "No plan file found"
+        return None
 
-        if not plan_file.exists():
-            return PhaseResult(
-                success=True,
-                artifacts={"skipped": "No plan file found"},
-            )
+    def _run_single_agent(self) -> PhaseResult:
+        plan_file = self.context.plan_file
+        review_file = self.context.plan_review_file
 
         prompt = f"""
 Review and improve the implementation plan for: {self.context.task_description}
@@ -700,7 +902,7 @@ class ImplementationPhase(Phase):
     timeout_seconds = 3600
 
     def run(self) -> PhaseResult:
-        plan_file = self.context.plans_dir / f"plan-{self.context.task_name}.md"
+        plan_file = self.context.plan_file
 
         plan_ref = ""
         if plan_file.exists():
@@ -751,7 +953,7 @@ class TestWritingPhase(Phase):
     timeout_seconds = 1200
 
     def run(self) -> PhaseResult:
-        plan_file = self.context.plans_dir / f"plan-{self.context.task_name}.md"
+        plan_file = self.context.plan_file
 
         prompt = f"""
 Write comprehensive tests for the implementation of: {self.context.task_description}
@@ -823,8 +1025,6 @@ class TestExecutionPhase(Phase):
         return self.executor
 
     def run(self) -> PhaseResult:
-        from selfassembler.errors import FailureCategory
-
         phase_config = self.get_phase_config()
         max_iterations = phase_config.max_iterations
         cmd_timeout = phase_config.command_timeout
@@ -843,6 +1043,10 @@ class TestExecutionPhase(Phase):
         baseline_enabled = phase_config.baseline_enabled
 
         if baseline_enabled:
+            # Read before the baseline run rather than in parallel with it:
+            # _capture_baseline stashes untracked files, which may include
+            # .sa-known-failures, so a concurrent read could miss it.
+            loaded_known_ids = load_known_failures(workdir)
             try:
                 captured_baseline, baseline_warning = self._capture_baseline(workdir, test_cmd, cmd_timeout)
             except RuntimeError as e:
@@ -861,9 +1065,10 @@ class TestExecutionPhase(Phase):
                     baseline_warnings.append(baseline_warning)
             else:
                 baseline_ids = captured_baseline
-                known_ids = load_known_failures(workdir)
+                known_ids = loaded_known_ids
 
         error_history: list[frozenset[str]] = []
+        seen_errors: set[frozenset[str]] = set()  # error_history as a set, for cycle checks
         # Per-executor session IDs: slot 0 = primary, slot 1 = secondary
         fix_sessions: dict[int, str | None] = {0: None, 1: None}
         test_result: dict = {}
@@ -915,15 +1120,15 @@ class TestExecutionPhase(Phase):
 
             # Only run cycle/stagnation detection when we have parseable fingerprints
             if current_errors:
-                if current_errors in error_history:
-                    run_command(workdir, "git checkout -- .", timeout=30)
+                if current_errors in seen_errors:
+                    self._restore_savepoint(workdir)
                     return PhaseResult(
                         success=False,
                         cost_usd=self.context.phase_costs.get(self.name, 0.0),
                         error="Test fix oscillation detected — same errors recurring",
                         artifacts={
                             "test_results": test_result,
-                            "output": output,
+                            "output": output[-_MAX_RESULT_OUTPUT_CHARS:],
                             "baseline_warnings": baseline_warnings,
                         },
                         failure_category=FailureCategory.OSCILLATING,
@@ -933,20 +1138,21 @@ class TestExecutionPhase(Phase):
                     prev = error_history[-1]
                     resolved = prev - current_errors
                     if not resolved:
-                        run_command(workdir, "git checkout -- .", timeout=30)
+                        self._restore_savepoint(workdir)
                         return PhaseResult(
                             success=False,
                             cost_usd=self.context.phase_costs.get(self.name, 0.0),
                             error="Test fix stagnation — no errors resolved across 2 iterations",
                             artifacts={
                                 "test_results": test_result,
-                                "output": output,
+                                "output": output[-_MAX_RESULT_OUTPUT_CHARS:],
                                 "baseline_warnings": baseline_warnings,
                             },
                             failure_category=FailureCategory.OSCILLATING,
                         )
 
                 error_history.append(current_errors)
+                seen_errors.add(current_errors)
 
             # Fix failures (except on last iteration)
             if iteration < max_iterations - 1:
@@ -959,14 +1165,14 @@ class TestExecutionPhase(Phase):
                     executor=cur_executor,
                 )
                 if fix_sessions[slot] is None:
-                    run_command(workdir, "git checkout -- .", timeout=30)
+                    self._restore_savepoint(workdir)
                     return PhaseResult(
                         success=False,
                         cost_usd=self.context.phase_costs.get(self.name, 0.0),
                         error="Unable to fix test failures",
                         artifacts={
                             "test_results": test_result,
-                            "output": output,
+                            "output": output[-_MAX_RESULT_OUTPUT_CHARS:],
                             "baseline_warnings": baseline_warnings,
                         },
                     )
@@ -977,7 +1183,7 @@ class TestExecutionPhase(Phase):
             error=f"Tests still failing after {max_iterations} iterations",
             artifacts={
                 "test_results": test_result,
-                "output": stdout + stderr,
+                "output": output[-_MAX_RESULT_OUTPUT_CHARS:],
                 "baseline_warnings": baseline_warnings,
             },
         )
@@ -991,23 +1197,55 @@ class TestExecutionPhase(Phase):
         so task-introduced failures are never mislabeled as pre-existing.
 
         Stores in context artifact so subsequent calls (retries, resume) reuse
-        the cached result.
+        the cached result. The result is also saved in the state store keyed
+        by HEAD commit and test command, so later runs against the same base
+        within ``BASELINE_CACHE_TTL_SECONDS`` skip the stash round-trip and
+        test run entirely.
         """
         existing = self.context.get_artifact("test_baseline_failures", None)
         if existing is not None:
             return existing, None  # Already captured (retry, resume, etc.)
 
-        # Stash all changes (including untracked) to test on clean base
-        stash_ok, _, stash_err = run_command(
-            workdir, "git stash push --include-untracked -m sa-baseline-capture", timeout=30,
-        )
-        if not stash_ok:
-            detail = stash_err.strip() or "unknown error"
-            return (
-                None,
-                "Baseline capture skipped: failed to stash local changes "
-                f"({detail}); continuing in strict test mode.",
+        store_key: str | None = None
+        worktree_clean = False
+        with contextlib.suppress(Exception):
+            git = GitManager(workdir)
+            digest = hashlib.sha256(f"{git.get_head_sha()}\0{test_cmd}".encode()).hexdigest()
+            store_key = f"baseline-{digest[:16]}"
+            worktree_clean = git.is_clean()[0]
+
+        if store_key:
+            cached = StateStore().load(store_key)
+            if isinstance(cached, dict):
+                failure_ids = cached.get("failure_ids")
+                captured_at = cached.get("captured_at")
+                if (
+                    isinstance(failure_ids, list)
+                    and all(isinstance(f, str) for f in failure_ids)
+                    and isinstance(captured_at, (int, float))
+                    and time.time() - captured_at < BASELINE_CACHE_TTL_SECONDS
+                ):
+                    self.context.set_artifact("test_baseline_failures", failure_ids)
+                    self.context.set_artifact(
+                        "test_baseline_exit_ok", cached.get("exit_ok") is True
+                    )
+                    return failure_ids, None
+
+        # Stash all changes (including untracked) to test on clean base.
+        # A clean worktree already is the base; stashing nothing would make
+        # the pop below fail (or pop an unrelated stash).
+        stash_ok = False
+        if not worktree_clean:
+            stash_ok, _, stash_err = run_command(
+                workdir, "git stash push --include-untracked -m sa-baseline-capture", timeout=30,
             )
+            if not stash_ok:
+                detail = stash_err.strip() or "unknown error"
+                return (
+                    None,
+                    "Baseline capture skipped: failed to stash local changes "
+                    f"({detail}); continuing in strict test mode.",
+                )
 
         try:
             success, stdout, stderr = run_command(workdir, test_cmd, timeout=cmd_timeout)
@@ -1027,6 +1265,12 @@ class TestExecutionPhase(Phase):
 
         self.context.set_artifact("test_baseline_failures", baseline)
         self.context.set_artifact("test_baseline_exit_ok", success)
+        if store_key:
+            with contextlib.suppress(OSError):
+                StateStore().save(
+                    store_key,
+                    {"failure_ids": baseline, "exit_ok": success, "captured_at": time.time()},
+                )
         return baseline, None
 
     def _run_with_claude_detection(self) -> PhaseResult:
@@ -1124,12 +1368,13 @@ class CodeReviewPhase(DebatePhase):
         return {"base_branch": self.config.git.base_branch}
 
     def _run_single_agent(self) -> PhaseResult:
-        review_file = self.context.plans_dir / f"review-{self.context.task_name}.md"
+        review_file = self.context.review_file
 
         prompt = f"""
 Review the implementation for: {self.context.task_description}
 
-1. Get the diff: git diff {self.config.git.base_branch}...HEAD
+1. Get the diff, including uncommitted changes: git diff $(git merge-base {self.config.git.base_branch} HEAD)
+   New files are untracked and not in the diff; list them with: git status --short
 
 2. Review for:
    - Logic errors or bugs
@@ -1200,7 +1445,7 @@ class FixReviewIssuesPhase(Phase):
     timeout_seconds = 900
 
     def run(self) -> PhaseResult:
-        review_file = self.context.plans_dir / f"review-{self.context.task_name}.md"
+        review_file = self.context.review_file
 
         if not review_file.exists():
             return PhaseResult(
@@ -1268,26 +1513,33 @@ class LintCheckPhase(Phase):
         return self.executor
 
     def run(self) -> PhaseResult:
-        from selfassembler.errors import FailureCategory
-
         workdir = self.context.get_working_dir()
         results = []
         phase_config = self.config.get_phase_config(self.name)
         max_iterations = phase_config.max_iterations
 
-        # Try configured or detected commands
-        lint_cmd = get_command(workdir, "lint", self.config.commands.lint)
-        typecheck_cmd = get_command(workdir, "typecheck", self.config.commands.typecheck)
-        format_cmd = get_command(workdir, "format")
+        # Try configured or detected commands. Detection probes for each tool
+        # and the changed-files diff are independent read-only subprocesses,
+        # so they run concurrently; the commands themselves stay sequential
+        # (format and lint --fix write files the later steps read).
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            lint_future = pool.submit(get_command, workdir, "lint", self.config.commands.lint)
+            typecheck_future = pool.submit(
+                get_command, workdir, "typecheck", self.config.commands.typecheck
+            )
+            format_future = pool.submit(get_command, workdir, "format")
+            changed_future = pool.submit(self._get_changed_files, workdir)
 
-        # Scope commands to changed files only (Improvement 2: diff-scoped linting)
-        from selfassembler.commands import scope_command_to_files
+            lint_cmd = lint_future.result()
+            typecheck_cmd = typecheck_future.result()
+            format_cmd = format_future.result()
+            # Scope commands to changed files only (Improvement 2: diff-scoped linting)
+            changed = changed_future.result()
 
-        try:
-            git = GitManager(workdir)
-            changed = git.get_changed_files(self.config.git.base_branch, cwd=workdir)
-        except Exception:
-            changed = []
+        # Nothing changed against the base: a full-repo scan would only
+        # report pre-existing issues the task never touched (opt-in skip).
+        if changed == [] and not phase_config.require_scan_on_empty:
+            return PhaseResult(success=True, artifacts={"skipped": "No changes vs base branch"})
 
         if changed and lint_cmd:
             scoped = scope_command_to_files(lint_cmd, changed, workdir)
@@ -1306,142 +1558,28 @@ class LintCheckPhase(Phase):
         # Run format first if available (no retry needed)
         if format_cmd:
             success, stdout, stderr = run_command(workdir, format_cmd, timeout=120)
-            results.append({"command": "format", "success": success, "output": stdout + stderr})
+            results.append(
+                {
+                    "command": "format",
+                    "success": success,
+                    "output": (stdout + stderr)[:_MAX_RESULT_OUTPUT_CHARS],
+                }
+            )
 
-        # Run lint with iterative fix loop + cycle detection
-        # Per-executor session IDs: slot 0 = primary, slot 1 = secondary
+        # Run lint, then typecheck, each with an iterative fix loop + cycle detection
         lint_success = True
         lint_failure_category = None
         if lint_cmd:
-            error_history: list[frozenset[str]] = []
-            fix_sessions: dict[int, str | None] = {0: None, 1: None}
-
-            for iteration in range(max_iterations):
-                success, stdout, stderr = run_command(workdir, lint_cmd, timeout=120)
-                output = stdout + stderr
-                cur_executor = self._get_executor_for_iteration(iteration)
-                agent_tag = "secondary" if cur_executor is self.secondary_executor else "primary"
-                results.append(
-                    {
-                        "command": f"lint_iter_{iteration + 1}({agent_tag})",
-                        "success": success,
-                        "output": output,
-                    }
-                )
-
-                if success:
-                    lint_success = True
-                    break
-
-                current_errors = self._parse_error_locations(output)
-
-                # Only run cycle/stagnation detection when we have parseable fingerprints
-                if current_errors:
-                    # Cycle detection: exact repeat
-                    if current_errors in error_history:
-                        run_command(workdir, "git checkout -- .", timeout=30)
-                        lint_success = False
-                        lint_failure_category = FailureCategory.OSCILLATING
-                        break
-
-                    # Stagnation detection: no errors resolved across 2 consecutive iterations
-                    if len(error_history) >= 2:
-                        prev = error_history[-1]
-                        resolved = prev - current_errors
-                        if not resolved:
-                            run_command(workdir, "git checkout -- .", timeout=30)
-                            lint_success = False
-                            lint_failure_category = FailureCategory.OSCILLATING
-                            break
-
-                    error_history.append(current_errors)
-
-                # Try to fix lint issues, alternating between primary/secondary
-                if iteration < max_iterations - 1:
-                    # Stage current state as savepoint before fix attempt
-                    run_command(workdir, "git add -A", timeout=30)
-
-                    # Build context for the fix prompt
-                    new_errors = current_errors - (error_history[-2] if len(error_history) >= 2 else frozenset())
-                    fixed_errors = (error_history[-2] if len(error_history) >= 2 else frozenset()) - current_errors
-
-                    slot = iteration % 2
-                    fix_sessions[slot] = self._fix_lint_issues(
-                        output, session_id=fix_sessions[slot],
-                        new_errors=new_errors, fixed_errors=fixed_errors,
-                        executor=cur_executor,
-                    )
-                    if fix_sessions[slot] is None:
-                        # Fix attempt failed — restore staged savepoint
-                        run_command(workdir, "git checkout -- .", timeout=30)
-                        lint_success = False
-                        break
-                else:
-                    lint_success = False
+            lint_success, lint_failure_category = self._run_check_loop(
+                "lint", lint_cmd, self._fix_lint_issues, max_iterations, 120, results
+            )
 
-        # Run typecheck with iterative fix loop + cycle detection
-        # Per-executor session IDs: slot 0 = primary, slot 1 = secondary
         typecheck_success = True
         typecheck_failure_category = None
         if typecheck_cmd:
-            error_history = []
-            fix_sessions = {0: None, 1: None}
-
-            for iteration in range(max_iterations):
-                success, stdout, stderr = run_command(workdir, typecheck_cmd, timeout=180)
-                output = stdout + stderr
-                cur_executor = self._get_executor_for_iteration(iteration)
-                agent_tag = "secondary" if cur_executor is self.secondary_executor else "primary"
-                results.append(
-                    {
-                        "command": f"typecheck_iter_{iteration + 1}({agent_tag})",
-                        "success": success,
-                        "output": output,
-                    }
-                )
-
-                if success:
-                    typecheck_success = True
-                    break
-
-                current_errors = self._parse_error_locations(output)
-
-                if current_errors:
-                    if current_errors in error_history:
-                        run_command(workdir, "git checkout -- .", timeout=30)
-                        typecheck_success = False
-                        typecheck_failure_category = FailureCategory.OSCILLATING
-                        break
-
-                    if len(error_history) >= 2:
-                        prev = error_history[-1]
-                        resolved = prev - current_errors
-                        if not resolved:
-                            run_command(workdir, "git checkout -- .", timeout=30)
-                            typecheck_success = False
-                            typecheck_failure_category = FailureCategory.OSCILLATING
-                            break
-
-                    error_history.append(current_errors)
-
-                if iteration < max_iterations - 1:
-                    run_command(workdir, "git add -A", timeout=30)
-
-                    new_errors = current_errors - (error_history[-2] if len(error_history) >= 2 else frozenset())
-                    fixed_errors = (error_history[-2] if len(error_history) >= 2 else frozenset()) - current_errors
-
-                    slot = iteration % 2
-                    fix_sessions[slot] = self._fix_type_issues(
-                        output, session_id=fix_sessions[slot],
-                        new_errors=new_errors, fixed_errors=fixed_errors,
-                        executor=cur_executor,
-                    )
-                    if fix_sessions[slot] is None:
-                        run_command(workdir, "git checkout -- .", timeout=30)
-                        typecheck_success = False
-                        break
-                else:
-                    typecheck_success = False
+            typecheck_success, typecheck_failure_category = self._run_check_loop(
+                "typecheck", typecheck_cmd, self._fix_type_issues, max_iterations, 180, results
+            )
 
         # Check overall success
         if not lint_success or not typecheck_success:
@@ -1472,18 +1610,118 @@ class LintCheckPhase(Phase):
 
         return PhaseResult(success=True, artifacts={"results": results})
 
+    def _get_changed_files(self, workdir: Path) -> list[str] | None:
+        """Files changed against the base branch, including uncommitted work.
+
+        Returns None if git could not tell (no repo, unknown base branch).
+        """
+        try:
+            return GitManager(workdir).get_changed_files(
+                self.config.git.base_branch, cwd=workdir, include_worktree=True
+            )
+        except Exception:
+            return None
+
+    def _run_check_loop(
+        self,
+        label: str,
+        cmd: str,
+        fixer: Callable[..., str | None],
+        max_iterations: int,
+        timeout: int,
+        results: list[dict[str, Any]],
+    ) -> tuple[bool, FailureCategory | None]:
+        """Run a lint/typecheck command, fixing issues until it passes.
+
+        Fix iterations alternate between primary and secondary executors and
+        stop early on oscillation (a repeated error set) or stagnation (no
+        errors resolved). Each run is appended to ``results``.
+
+        Returns:
+            Tuple of (success, failure_category)
+        """
+        workdir = self.context.get_working_dir()
+        error_history: list[frozenset[str]] = []
+        seen_errors: set[frozenset[str]] = set()  # error_history as a set, for cycle checks
+        # Per-executor session IDs: slot 0 = primary, slot 1 = secondary
+        fix_sessions: dict[int, str | None] = {0: None, 1: None}
+
+        for iteration in range(max_iterations):
+            success, stdout, stderr = run_command(workdir, cmd, timeout=timeout)
+            output = stdout + stderr
+            cur_executor = self._get_executor_for_iteration(iteration)
+            agent_tag = "secondary" if cur_executor is self.secondary_executor else "primary"
+            results.append(
+                {
+                    "command": f"{label}_iter_{iteration + 1}({agent_tag})",
+                    "success": success,
+                    "output": output[:_MAX_RESULT_OUTPUT_CHARS],
+                }
+            )
+
+            if success:
+                return True, None
+
+            current_errors = self._parse_error_locations(output)
+
+            # Only run cycle/stagnation detection when we have parseable fingerprints
+            if current_errors:
+                # Cycle detection: exact repeat
+                if current_errors in seen_errors:
+                    self._restore_savepoint(workdir)
+                    return False, FailureCategory.OSCILLATING
+
+                # Stagnation detection: no errors resolved across 2 consecutive iterations
+                if len(error_history) >= 2:
+                    prev = error_history[-1]
+                    resolved = prev - current_errors
+                    if not resolved:
+                        self._restore_savepoint(workdir)
+                        return False, FailureCategory.OSCILLATING
+
+                error_history.append(current_errors)
+                seen_errors.add(current_errors)
+
+            if iteration == max_iterations - 1:
+                break
+
+            # Stage current state as savepoint before fix attempt
+            run_command(workdir, "git add -A", timeout=30)
+
+            # Build context for the fix prompt
+            prev_errors = error_history[-2] if len(error_history) >= 2 else _NO_ERRORS
+            new_errors = current_errors - prev_errors
+            fixed_errors = prev_errors - current_errors
+
+            slot = iteration % 2
+            fix_sessions[slot] = fixer(
+                output, session_id=fix_sessions[slot],
+                new_errors=new_errors, fixed_errors=fixed_errors,
+                executor=cur_executor,
+            )
+            if fix_sessions[slot] is None:
+                # Fix attempt failed — restore staged savepoint
+                self._restore_savepoint(workdir)
+                return False, None
+
+            if not self._changed_since_savepoint(workdir):
+                # Nothing was edited, so a re-run would report the same errors
+                return False, FailureCategory.OSCILLATING
+
+        return False, None
+
     @staticmethod
     def _parse_error_locations(output: str) -> frozenset[str]:
-        """Extract error fingerprints from lint/typecheck output."""
-        errors = set()
-        for line in output.splitlines():
-            # mypy: "file.py:42: error: Something [code]"
-            # ruff: "file.py:42:10: E501 ..."
-            # eslint: "/path/file.js  42:10  error  ..."
-            m = re.match(r'(\S+?:\d+(?::\d+)?)\s*[:\s]', line)
-            if m:
-                errors.add(m.group(1))
-        return frozenset(errors)
+        """Extract error fingerprints from lint/typecheck output.
+
+        Only the complete lines within the first ``_MAX_PARSE_CHARS``
+        characters are scanned, so identical output always yields the same
+        fingerprints while the cost stays bounded.
+        """
+        if len(output) > _MAX_PARSE_CHARS:
+            output = output[: output.rfind("\n", 0, _MAX_PARSE_CHARS) + 1]
+        match = _ERROR_LOCATION_RE.match
+        return frozenset(m.group(1) for m in map(match, output.splitlines()) if m)
 
     def _fix_lint_issues(
         self,
@@ -1593,7 +1831,7 @@ class DocumentationPhase(Phase):
     timeout_seconds = 600
 
     def run(self) -> PhaseResult:
-        plan_path = self.context.plans_dir / f"plan-{self.context.task_name}.md"
+        plan_path = self.context.plan_file
         prompt = f"""
 Update documentation for: {self.context.task_description}
 
@@ -1929,13 +2167,12 @@ Return the PR URL after creation.
 
             self.context.add_cost(self.name, result.cost_usd)
 
-            # Try to extract PR URL from output
-            pr_url = self._extract_pr_url(result.output)
-            if pr_url:
+            # Try to extract PR URL and number from output
+            pr_url = None
+            pr = self._extract_pr_url(result.output)
+            if pr:
+                pr_url, self.context.pr_number = pr
                 self.context.pr_url = pr_url
-                # Extract PR number
-                with contextlib.suppress(ValueError, IndexError):
-                    self.context.pr_number = int(pr_url.split("/")[-1])
 
             return PhaseResult(
                 success=not result.is_error,
@@ -1947,12 +2184,20 @@ Return the PR URL after creation.
         except Exception as e:
             return PhaseResult(success=False, error=str(e))
 
-    def _extract_pr_url(self, output: str) -> str | None:
-        """Extract PR URL from output."""
-        # Match GitHub PR URLs
-        pattern = r"https://github\.com/[^/]+/[^/]+/pull/\d+"
-        match = re.search(pattern, output)
-        return match.group(0) if match else None
+    def _extract_pr_url(self, output: str) -> tuple[str, int] | None:
+        """Extract PR URL and number from output.
+
+        The new PR's URL comes last (``gh pr create`` prints it, then the agent
+        reports it), so scan backwards and only try the pattern where a GitHub
+        URL starts.
+        """
+        end = len(output)
+        while (start := output.rfind("https://github.com/", 0, end)) >= 0:
+            match = _PR_URL_RE.match(output, start)
+            if match:
+                return match.group(0), int(match.group(1))
+            end = start
+        return None
 
 
 class PRSelfReviewPhase(Phase):
@@ -1975,10 +2220,25 @@ class PRSelfReviewPhase(Phase):
                 artifacts={"skipped": "No PR number available"},
             )
 
+        workdir = self.context.get_working_dir()
+        phase_config = self.get_phase_config()
+        diff = self._get_pr_diff(workdir)
+        min_lines = phase_config.min_diff_lines
+        if diff is not None and _count_changed_lines(diff, min_lines) < min_lines:
+            return PhaseResult(
+                success=True,
+                artifacts={"skipped": "trivial_diff"},
+            )
+
+        if diff and len(diff) <= _MAX_INLINE_DIFF_CHARS:
+            diff_step = f"1. The full diff of the PR:\n\n```diff\n{diff}\n```"
+        else:
+            diff_step = f"1. Fetch the full diff: `gh pr diff {pr_number}`"
+
         prompt = f"""
 Review PR #{pr_number} as a critical code reviewer.
 
-1. Fetch the full diff: `gh pr diff {pr_number}`
+{diff_step}
 
 2. Review for:
    - Logic errors or bugs
@@ -2000,7 +2260,6 @@ Review PR #{pr_number} as a critical code reviewer.
 
 Be critical but fair. Look for real issues, not style nitpicks.
 """
-        phase_config = self.get_phase_config()
         result = self.executor.execute(
             prompt=prompt,
             permission_mode=self._get_permission_mode(),
@@ -2008,7 +2267,7 @@ Be critical but fair. Look for real issues, not style nitpicks.
             max_turns=phase_config.max_turns,
             timeout=phase_config.timeout,
             dangerous_mode=self._dangerous_mode(),
-            working_dir=self.context.get_working_dir(),
+            working_dir=workdir,
         )
 
         self.context.add_cost(self.name, result.cost_usd)
@@ -2019,6 +2278,23 @@ Be critical but fair. Look for real issues, not style nitpicks.
             error=result.output if result.is_error else None,
         )
 
+    def _get_pr_diff(self, workdir: Path) -> str | None:
+        """Diff of the pushed branch against base, read from the local repo.
+
+        Saves the reviewer a `gh pr diff` round trip. Like ConflictCheckPhase,
+        compares against ``origin/<base>`` when there is a remote, since the
+        branch was rebased onto it and local base may be stale. Returns None
+        on error.
+        """
+        base_branch = self.config.git.base_branch
+        try:
+            git = GitManager(workdir)
+            if git.has_remote():
+                base_branch = f"origin/{base_branch}"
+            return git.get_diff(base_branch, cwd=workdir)
+        except Exception:
+            return None
+
 
 # Phase registry for the orchestrator
 PHASE_CLASSES: list[type[Phase]] = [
@@ -2042,3 +2318,6 @@ PHASE_CLASSES: list[type[Phase]] = [
 ]
 
 PHASE_NAMES = [cls.name for cls in PHASE_CLASSES]
+
+# Phase name -> position in PHASE_CLASSES, for O(1) skip/resume lookups
+PHASE_INDEX: dict[str, int] = {name: i for i, name in enumerate(PHASE_NAMES)}
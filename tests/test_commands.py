@@ -1,15 +1,20 @@
 """Tests for command detection."""
 
+import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from selfassembler.commands import (
+    _pytest_interpreter,
+    _python_can_import,
     detect_all_project_types,
     detect_project_type,
     diff_test_failures,
     extract_failure_ids,
     get_command,
     load_known_failures,
+    parallelize_test_command,
     parse_test_output,
 )
 
@@ -84,6 +89,89 @@ class TestGetCommand:
             result = get_command(path, "test")
             assert result is None
 
+    def test_get_command_project_local_executable(self):
+        """Test ./gradlew is resolved against the project directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / "build.gradle").touch()
+            assert get_command(path, "test") is None
+
+            gradlew = path / "gradlew"
+            gradlew.write_text("#!/bin/sh\n")
+            gradlew.chmod(0o755)
+            assert get_command(path, "test") == "./gradlew test"
+
+
+class TestParallelizeTestCommand:
+    """Tests for parallelizing auto-detected test commands."""
+
+    def test_pytest_with_xdist(self):
+        """Test pytest gets -n auto when the project declares pytest-xdist."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / "pyproject.toml").write_text('[dev]\ndeps = ["pytest", "pytest-xdist"]\n')
+
+            with patch("selfassembler.commands.available_cores", return_value=8), \
+                 patch("selfassembler.commands._pytest_interpreter", return_value=[sys.executable]), \
+                 patch("selfassembler.commands._python_can_import", return_value=True):
+                assert parallelize_test_command("pytest", path) == "pytest -n auto"
+                assert (
+                    parallelize_test_command("python -m pytest", path)
+                    == "python -m pytest -n auto"
+                )
+                assert parallelize_test_command("pytest -n 4", path) == "pytest -n 4"
+
+            with patch("selfassembler.commands.available_cores", return_value=2):
+                assert parallelize_test_command("pytest", path) == "pytest"
+
+    def test_pytest_without_xdist(self):
+        """Test pytest is unchanged when pytest-xdist is not declared."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / "pyproject.toml").write_text('[dev]\ndeps = ["pytest"]\n')
+
+            assert parallelize_test_command("pytest", path) == "pytest"
+
+    def test_declared_but_not_installed(self):
+        """Test pytest is unchanged when the test interpreter cannot import xdist."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / "requirements-dev.txt").write_text("pytest-xdist\n")
+
+            with patch("selfassembler.commands.available_cores", return_value=8), \
+                 patch("selfassembler.commands._pytest_interpreter", return_value=[sys.executable]), \
+                 patch("selfassembler.commands._python_can_import", return_value=False) as can_import:
+                assert parallelize_test_command("pytest", path) == "pytest"
+            can_import.assert_called_once_with([sys.executable], "xdist")
+
+    def test_pytest_interpreter_from_shebang(self):
+        """Test the pytest script's shebang names the interpreter to probe."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            script = Path(tmpdir) / "pytest"
+            script.write_text("#!/opt/venv/bin/python3\nimport pytest\n")
+
+            with patch("selfassembler.commands.shutil.which", return_value=str(script)):
+                assert _pytest_interpreter(["pytest"]) == ["/opt/venv/bin/python3"]
+                assert _pytest_interpreter(["python", "-m", "pytest"]) == [str(script)]
+
+            with patch("selfassembler.commands.shutil.which", return_value=None):
+                assert _pytest_interpreter(["pytest"]) is None
+
+    def test_python_can_import(self):
+        """Test module availability is checked in the given interpreter."""
+        assert _python_can_import([sys.executable], "json") is True
+        assert _python_can_import([sys.executable], "no_such_module_for_sa") is False
+        assert _python_can_import(["/nonexistent/python"], "json") is False
+
+    def test_other_runners_unchanged(self):
+        """Test runners that already parallelize are left alone."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            (path / "requirements.txt").write_text("pytest-xdist\n")
+
+            assert parallelize_test_command("go test ./...", path) == "go test ./..."
+            assert parallelize_test_command("npm test", path) == "npm test"
+
 
 class TestParseTestOutput:
     """Tests for parsing test output."""
@@ -90,6 +90,15 @@ class TestWorkflowContext:
         context.worktree_path = Path("/test/worktree")
         assert context.get_working_dir() == Path("/test/worktree")
 
+    def test_plan_files(self, context: WorkflowContext):
+        """Test plan file paths follow plans_dir."""
+        assert context.plan_file == Path("/test/plans/plan-test-task.md")
+        assert context.research_file == Path("/test/plans/research-test-task.md")
+        assert context.review_file == Path("/test/plans/review-test-task.md")
+
+        context.plans_dir = Path("/test/worktree/plans")
+        assert context.plan_file == Path("/test/worktree/plans/plan-test-task.md")
+
     def test_serialization(self, context: WorkflowContext):
         """Test serialization and deserialization."""
         context.add_cost("phase1", 2.5)
@@ -102,6 +111,7 @@ class TestWorkflowContext:
         assert restored.task_name == context.task_name
         assert restored.total_cost_usd == context.total_cost_usd
         assert restored.completed_phases == context.completed_phases
+        assert restored.is_phase_completed("phase1")
         assert restored.artifacts == context.artifacts
 
     def test_summary(self, context: WorkflowContext):
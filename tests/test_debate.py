@@ -439,6 +439,33 @@ class TestPromptGenerators:
             prompt = generator.turn1_primary_prompt(plans_dir / "review.md")
             assert "develop" in prompt  # Should use custom base branch
 
+    def test_prompts_reference_context_plan_files(self):
+        """Test debate prompts point at the same plan/research files as the context."""
+        from selfassembler.context import WorkflowContext
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plans_dir = Path(tmpdir)
+            context = WorkflowContext(
+                task_description="Test",
+                task_name="test",
+                repo_path=plans_dir,
+                plans_dir=plans_dir,
+            )
+            context.research_file.write_text("notes")
+
+            planning = get_prompt_generator(
+                phase_name="planning", task_description="Test", task_name="test",
+                plans_dir=plans_dir,
+            )
+            review = get_prompt_generator(
+                phase_name="plan_review", task_description="Test", task_name="test",
+                plans_dir=plans_dir,
+            )
+            output = plans_dir / "out.md"
+
+            assert str(context.research_file) in planning.turn1_primary_prompt(output)
+            assert str(context.plan_file) in review.turn1_primary_prompt(output)
+
     def test_get_prompt_generator_factory(self):
         """Test get_prompt_generator factory function."""
         with tempfile.TemporaryDirectory() as tmpdir:
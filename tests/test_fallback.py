@@ -92,6 +92,7 @@ class TestShouldAttemptFallback:
             orch = Orchestrator.__new__(Orchestrator)
             orch.context = ctx
             orch.config = config
+            orch._rebind_config()
             orch.executor = executor
             orch.fallback_executor = fallback_executor or _make_executor("codex")
             orch.secondary_executor = None
@@ -221,6 +222,7 @@ class TestAttemptFallback:
             orch = Orchestrator.__new__(Orchestrator)
             orch.context = ctx
             orch.config = config
+            orch._rebind_config()
             orch.executor = executor
             orch.fallback_executor = fallback_executor or _make_executor("codex")
             orch.secondary_executor = None
@@ -374,6 +376,7 @@ class TestRunPhaseIntegration:
             orch = Orchestrator.__new__(Orchestrator)
             orch.context = ctx
             orch.config = config
+            orch._rebind_config()
             orch.executor = executor
             orch.fallback_executor = fallback_executor or _make_executor("codex")
             orch.secondary_executor = None
@@ -616,6 +619,7 @@ class TestCreateFallbackExecutor:
             orch = Orchestrator.__new__(Orchestrator)
             orch.context = ctx
             orch.config = config
+            orch._rebind_config()
             orch.executor = executor
             orch.fallback_executor = None
             orch.secondary_executor = None
@@ -690,6 +694,7 @@ class TestAdditionalShouldAttemptFallback:
             orch = Orchestrator.__new__(Orchestrator)
             orch.context = ctx
             orch.config = config
+            orch._rebind_config()
             orch.executor = executor
             orch.fallback_executor = fallback_executor or _make_executor("codex")
             orch.secondary_executor = None
@@ -722,6 +727,7 @@ class TestAdditionalAttemptFallback:
             orch = Orchestrator.__new__(Orchestrator)
             orch.context = ctx
             orch.config = config
+            orch._rebind_config()
             orch.executor = executor
             orch.fallback_executor = fallback_executor or _make_executor("codex")
             orch.secondary_executor = None
@@ -783,6 +789,7 @@ class TestAdditionalRunPhaseIntegration:
             orch = Orchestrator.__new__(Orchestrator)
             orch.context = ctx
             orch.config = config
+            orch._rebind_config()
             orch.executor = executor
             orch.fallback_executor = fallback_executor or _make_executor("codex")
             orch.secondary_executor = None
@@ -830,3 +837,33 @@ class TestAdditionalRunPhaseIntegration:
 
         with pytest.raises(Exception):  # PhaseFailedError
             orch._run_phase(phase)
+
+
+class TestRebindConfig:
+    """Tests for Orchestrator._rebind_config cached config values."""
+
+    def _make_orchestrator(self, config=None):
+        from selfassembler.orchestrator import Orchestrator
+
+        with patch.object(Orchestrator, "__init__", lambda self, *a, **kw: None):
+            orch = Orchestrator.__new__(Orchestrator)
+            orch.context = _make_context()
+            orch.config = config or _make_config()
+            orch._rebind_config()
+        return orch
+
+    def test_binds_fallback_attempts(self):
+        orch = self._make_orchestrator(config=_make_config(max_fallback_attempts=3))
+        assert orch._max_fallback_attempts == 3
+
+    def test_rebind_picks_up_config_overrides(self):
+        config = _make_config()
+        config.approvals.enabled = True
+        orch = self._make_orchestrator(config=config)
+        assert orch._approvals_enabled is True
+
+        # CLI resume overrides mutate the config in place
+        orch.config.approvals.enabled = False
+        orch._rebind_config()
+
+        assert orch._approvals_enabled is False
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from selfassembler.errors import GitOperationError
-from selfassembler.git import GitManager
+from selfassembler.git import GitManager, find_config_files
 
 
 class TestGitManagerInit:
@@ -309,6 +309,26 @@ class TestGitManagerCleanupUnreachableRemote:
         assert removed is False
 
 
+class TestGitManagerHasRemote:
+    """Tests for has_remote method."""
+
+    @patch("selfassembler.git.GitManager._validate_repo")
+    @patch("selfassembler.git.GitManager._run")
+    def test_result_remembered_until_removed(self, mock_run, mock_validate):
+        """Test the remote lookup runs once per instance until the remote is removed."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="https://github.com/o/r\n")
+
+        manager = GitManager(Path("/test/repo"))
+        assert manager.has_remote() is True
+        assert manager.has_remote() is True
+        assert mock_run.call_count == 1
+
+        manager.remove_remote("origin")
+        mock_run.return_value = MagicMock(returncode=2, stdout="")
+        assert manager.has_remote() is False
+        assert mock_run.call_count == 3
+
+
 class TestGitManagerIsClean:
     """Tests for is_clean method."""
 
@@ -339,6 +359,37 @@ class TestGitManagerIsClean:
         assert "modified_file.py" in output
 
 
+class TestGitManagerGetStatus:
+    """Tests for get_status method."""
+
+    @patch("selfassembler.git.GitManager._validate_repo")
+    @patch("selfassembler.git.GitManager._run")
+    def test_get_status_tracking_branch(self, mock_run, mock_validate):
+        """Test branch and changes are parsed from one status call."""
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="## main...origin/main [behind 2]\n M file.py\n"
+        )
+
+        manager = GitManager(Path("/test/repo"))
+        branch, output = manager.get_status()
+
+        assert branch == "main"
+        assert output == "M file.py"
+        mock_run.assert_called_once_with(["status", "--porcelain", "--branch"], cwd=None)
+
+    @patch("selfassembler.git.GitManager._validate_repo")
+    @patch("selfassembler.git.GitManager._run")
+    def test_get_status_detached(self, mock_run, mock_validate):
+        """Test detached HEAD reports HEAD like get_current_branch."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="## HEAD (no branch)\n")
+
+        manager = GitManager(Path("/test/repo"))
+        branch, output = manager.get_status()
+
+        assert branch == "HEAD"
+        assert output == ""
+
+
 class TestGitManagerRun:
     """Tests for _run method."""
 
@@ -469,3 +520,20 @@ class TestGitManagerWorktree:
         worktrees = manager.list_worktrees()
 
         assert len(worktrees) == 2
+
+
+class TestFindConfigFiles:
+    """Tests for find_config_files."""
+
+    def test_literal_and_glob_patterns(self, tmp_path: Path):
+        """Test literal names and globs are both matched, without duplicates."""
+        (tmp_path / ".env").write_text("A=1")
+        (tmp_path / ".claude").mkdir()
+        (tmp_path / ".claude" / "settings.json").write_text("{}")
+        (tmp_path / ".claude" / "nested").mkdir()
+
+        found = find_config_files(
+            tmp_path, [".env", ".env.local", ".claude/*", ".claude/settings.json"]
+        )
+
+        assert found == [tmp_path / ".env", tmp_path / ".claude" / "settings.json"]
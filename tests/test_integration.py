@@ -145,6 +145,12 @@ class TestGitIdentityIntegration:
 class TestPreflightIntegration:
     """Tests for PreflightPhase against real repos."""
 
+    @pytest.fixture(autouse=True)
+    def state_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Keep the preflight probe cache out of the real state directory."""
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+        return tmp_path / "state"
+
     def _make_preflight(self, repo: Path):
         """Create a PreflightPhase with minimal mocked context/executor/config."""
         from unittest.mock import MagicMock
@@ -241,6 +247,81 @@ class TestSetupIntegration:
         gm.remove_worktree(wt_path, force=True)
         assert not wt_path.exists()
 
+    def test_setup_phase_copies_config_files(self, tmp_path: Path) -> None:
+        """SetupPhase copies untracked config files into the worktree."""
+        from unittest.mock import MagicMock
+
+        from selfassembler.config import WorkflowConfig
+        from selfassembler.context import WorkflowContext
+        from selfassembler.phases import SetupPhase
+
+        repo = make_repo(tmp_path / "repo")
+        subprocess.run(
+            ["git", "branch", "-M", "main"], cwd=repo, check=True,
+        )
+        (repo / ".env").write_text("KEY=value\n")
+        (repo / "selfassembler.yaml").write_text("budget_limit_usd: 5\n")
+
+        config = WorkflowConfig()
+        config.git.worktree_dir = str(tmp_path / "worktrees")
+        config.copy_files = [".env"]
+        context = WorkflowContext(
+            task_description="Test",
+            task_name="copy-task",
+            repo_path=repo,
+            plans_dir=repo / "plans",
+        )
+
+        result = SetupPhase(context, MagicMock(), config).run()
+
+        assert result.success is True
+        wt_path = Path(result.artifacts["worktree_path"])
+        assert (wt_path / ".env").read_text() == "KEY=value\n"
+        assert (wt_path / "selfassembler.yaml").exists()
+
+        GitManager(repo).remove_worktree(wt_path, force=True)
+
+    def test_restore_worktree_keeps_staged_savepoint(self, tmp_path: Path) -> None:
+        """restore_worktree() drops unstaged edits but keeps staged ones."""
+        repo = make_repo(tmp_path / "repo")
+        readme = repo / "README.md"
+        readme.write_text("# staged\n")
+        subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+        readme.write_text("# unstaged\n")
+
+        assert GitManager(repo).restore_worktree() is True
+        assert readme.read_text() == "# staged\n"
+
+    def test_has_unstaged_changes_after_savepoint(self, tmp_path: Path) -> None:
+        """has_unstaged_changes() ignores staged work but sees later edits and new files."""
+        repo = make_repo(tmp_path / "repo")
+        git = GitManager(repo)
+        (repo / "README.md").write_text("# staged\n")
+        subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+        assert git.has_unstaged_changes() is False
+
+        (repo / "new.py").write_text("x = 1\n")
+        assert git.has_unstaged_changes() is True
+
+    def test_changed_files_include_worktree(self, tmp_path: Path) -> None:
+        """get_changed_files(include_worktree=True) sees commits, edits and new files."""
+        repo = make_repo(tmp_path / "repo")
+        git = GitManager(repo)
+        base = git.get_current_branch()
+        subprocess.run(["git", "checkout", "-q", "-b", "feature"], cwd=repo, check=True)
+        (repo / "committed.py").write_text("x = 1\n")
+        subprocess.run(["git", "add", "committed.py"], cwd=repo, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "add"], cwd=repo, check=True)
+        (repo / "README.md").write_text("# edited\n")
+        (repo / "new.py").write_text("y = 2\n")
+
+        assert git.get_changed_files(base) == ["committed.py"]
+        assert sorted(git.get_changed_files(base, include_worktree=True)) == [
+            "README.md",
+            "committed.py",
+            "new.py",
+        ]
+
 
 # ── CLI Tests ────────────────────────────────────────────────────────────
 
@@ -0,0 +1,35 @@
+"""Tests for notifications."""
+
+from unittest.mock import MagicMock, patch
+
+from selfassembler.executors.base import StreamEvent
+from selfassembler.notifications import Notifier, WebhookChannel
+
+
+class TestWebhookStreamEvents:
+    """Tests for stream output routing to webhooks."""
+
+    def _stream(self, notifier: Notifier) -> None:
+        """Send one tool call, assistant message and system message."""
+        notifier.on_stream_event(StreamEvent(event_type="tool_use", data={"name": "Read"}))
+        notifier.on_stream_event(StreamEvent(event_type="assistant", data={"content": "Hello"}))
+        notifier.on_stream_event(StreamEvent(event_type="system", data={"message": "start"}))
+
+    def test_stream_events_filtered_by_default(self):
+        """Test webhooks do not post per-chunk stream output unless configured."""
+        notifier = Notifier([WebhookChannel("https://example.com/hook")])
+
+        with patch("selfassembler.notifications.urllib.request.urlopen") as urlopen:
+            self._stream(notifier)
+
+        urlopen.assert_not_called()
+
+    def test_stream_events_sent_when_configured(self):
+        """Test listing "stream" in webhook events posts stream output."""
+        notifier = Notifier([WebhookChannel("https://example.com/hook", events=["stream"])])
+
+        with patch("selfassembler.notifications.urllib.request.urlopen") as urlopen:
+            urlopen.return_value.__enter__.return_value = MagicMock(status=200)
+            self._stream(notifier)
+
+        assert urlopen.call_count == 3
@@ -0,0 +1,172 @@
+"""Tests for orchestrator helpers."""
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, mock_open, patch
+
+import pytest
+
+from selfassembler.errors import ContainerRequiredError
+from selfassembler.orchestrator import Orchestrator, WorkflowLogger, _detect_container_runtime
+
+# Banners as previously printed with print(..., file=sys.stderr)
+_OLD_CONTAINER_ERROR_BANNER = """
+╔══════════════════════════════════════════════════════════════════╗
+║  ERROR: Autonomous mode requires container isolation             ║
+╠══════════════════════════════════════════════════════════════════╣
+║                                                                  ║
+║  Autonomous mode grants Claude full system access, including:    ║
+║  - Execute any shell command                                     ║
+║  - Read/write any file you have access to                        ║
+║  - Make network requests                                         ║
+║                                                                  ║
+║  To protect your system, run inside a Docker container:          ║
+║                                                                  ║
+║    ./run-autonomous.sh /path/to/project "task" task-name         ║
+║                                                                  ║
+║  Or build and run manually:                                      ║
+║                                                                  ║
+║    docker build -t selfassembler .                                ║
+║    docker run -v /project:/workspace selfassembler "task"         ║
+║                                                                  ║
+║  To bypass (NOT RECOMMENDED):                                    ║
+║    export SELFASSEMBLER_ALLOW_HOST_AUTONOMOUS="I_ACCEPT_THE_RISK" ║
+║                                                                  ║
+╚══════════════════════════════════════════════════════════════════╝
+"""
+
+_OLD_CONTAINER_OVERRIDE_BANNER = """
+⚠️  WARNING: Running autonomous mode on HOST SYSTEM
+⚠️  Claude has full access to your files and system
+⚠️  You accepted this risk via SELFASSEMBLER_ALLOW_HOST_AUTONOMOUS
+"""
+
+
+def _logger_threads() -> list[threading.Thread]:
+    """Return the running WorkflowLogger writer threads."""
+    return [t for t in threading.enumerate() if t.name == "workflow-logger"]
+
+
+class TestWorkflowLogger:
+    """Tests for WorkflowLogger."""
+
+    def test_writer_starts_on_first_entry(self, tmp_path: Path):
+        """Test an unused logger holds no thread or open files."""
+        before = len(_logger_threads())
+        logger = WorkflowLogger(tmp_path, "task")
+
+        assert len(_logger_threads()) == before
+        assert not logger.log_file.exists()
+
+        logger.log("phase_started", phase="setup")
+        assert len(_logger_threads()) == before + 1
+
+        logger.close()
+        assert len(_logger_threads()) == before
+        entry = json.loads(logger.json_log_file.read_text())
+        assert entry["event"] == "phase_started"
+        assert entry["phase"] == "setup"
+
+    def test_log_after_close_does_not_reopen(self, tmp_path: Path):
+        """Test entries logged after close() are appended without leaking handles."""
+        logger = WorkflowLogger(tmp_path, "task")
+        logger.log("first")
+        logger.close()
+
+        logger.log("second")
+
+        assert logger._text_fh is None
+        assert logger._json_fh is None
+        assert logger._writer is not None and not logger._writer.is_alive()
+        lines = logger.json_log_file.read_text().splitlines()
+        events = [json.loads(line)["event"] for line in lines]
+        assert events == ["first", "second"]
+        assert "second" in logger.log_file.read_text()
+
+    def test_close_without_entries(self, tmp_path: Path):
+        """Test closing an unused logger is a no-op."""
+        logger = WorkflowLogger(tmp_path, "task")
+        logger.close()
+        logger.close()
+
+        assert not logger.log_file.exists()
+
+
+class TestDetectContainerRuntime:
+    """Tests for the cached container runtime detection."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Don't let a cached result leak between tests."""
+        _detect_container_runtime.cache_clear()
+        yield
+        _detect_container_runtime.cache_clear()
+
+    def test_dockerenv(self):
+        """Test /.dockerenv marks a container."""
+        with patch("selfassembler.orchestrator.os.path.exists", return_value=True):
+            assert _detect_container_runtime() is True
+
+    @pytest.mark.parametrize(
+        ("cgroup", "expected"),
+        [
+            ("0::/docker/abc123\n", True),
+            ("0::/kubepods/burstable/pod1\n", True),
+            ("0::/init.scope\n", False),
+        ],
+    )
+    def test_cgroup(self, cgroup: str, expected: bool):
+        """Test the init process cgroup identifies Docker and Kubernetes."""
+        with patch("selfassembler.orchestrator.os.path.exists", return_value=False), \
+             patch("builtins.open", mock_open(read_data=cgroup)):
+            assert _detect_container_runtime() is expected
+
+    def test_no_cgroup_file(self):
+        """Test hosts without /proc/1/cgroup are not containers."""
+        with patch("selfassembler.orchestrator.os.path.exists", return_value=False), \
+             patch("builtins.open", side_effect=FileNotFoundError):
+            assert _detect_container_runtime() is False
+
+    def test_result_is_cached(self):
+        """Test the filesystem is probed once per process."""
+        with patch("selfassembler.orchestrator.os.path.exists", return_value=True) as exists:
+            assert _detect_container_runtime() is True
+            assert _detect_container_runtime() is True
+
+        assert exists.call_count == 1
+
+
+class TestContainerBanners:
+    """Tests for the autonomous-mode container banners."""
+
+    def test_error_banner(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the host refusal banner renders as before."""
+        monkeypatch.delenv("SELFASSEMBLER_ALLOW_HOST_AUTONOMOUS", raising=False)
+        with patch("selfassembler.orchestrator._detect_container_runtime", return_value=False), \
+             pytest.raises(ContainerRequiredError):
+            Orchestrator._enforce_container_runtime(MagicMock())
+
+        assert capsys.readouterr().err == _OLD_CONTAINER_ERROR_BANNER + "\n"
+
+    def test_override_banner(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the host override warning renders as before."""
+        monkeypatch.setenv("SELFASSEMBLER_ALLOW_HOST_AUTONOMOUS", "I_ACCEPT_THE_RISK")
+        with patch("selfassembler.orchestrator._detect_container_runtime", return_value=False):
+            Orchestrator._enforce_container_runtime(MagicMock())
+
+        assert capsys.readouterr().err == _OLD_CONTAINER_OVERRIDE_BANNER + "\n"
+
+    def test_no_banner_in_container(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test nothing is printed inside a container."""
+        monkeypatch.delenv("SELFASSEMBLER_ALLOW_HOST_AUTONOMOUS", raising=False)
+        with patch("selfassembler.orchestrator._detect_container_runtime", return_value=True):
+            Orchestrator._enforce_container_runtime(MagicMock())
+
+        assert capsys.readouterr().err == ""
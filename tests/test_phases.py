@@ -1,5 +1,8 @@
 """Tests for workflow phases."""
 
+import json
+import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -10,6 +13,7 @@ from selfassembler.context import WorkflowContext
 from selfassembler.executors import MockClaudeExecutor, MockCodexExecutor
 from selfassembler.phases import (
     PHASE_CLASSES,
+    PHASE_INDEX,
     PHASE_NAMES,
     CodeReviewPhase,
     ImplementationPhase,
@@ -56,10 +60,21 @@ class TestPhaseRegistry:
         ]
         assert expected_order == PHASE_NAMES
 
+    def test_phase_index_matches_order(self):
+        """Test that PHASE_INDEX maps each name to its position."""
+        for i, name in enumerate(PHASE_NAMES):
+            assert PHASE_INDEX[name] == i
+
 
 class TestPreflightPhase:
     """Tests for PreflightPhase."""
 
+    @pytest.fixture(autouse=True)
+    def state_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Keep the preflight probe cache out of the real state directory."""
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+        return tmp_path / "state"
+
     @pytest.fixture
     def context(self) -> WorkflowContext:
         """Create a workflow context for testing."""
@@ -127,6 +142,121 @@ class TestPreflightPhase:
         # Name should include agent type
         assert "claude" in result["name"]
 
+    def test_passed_probe_is_cached(self, phase: PreflightPhase):
+        """Test a passing CLI probe is reused for the same binary."""
+        with (
+            patch("selfassembler.phases.shutil.which", return_value=sys.executable),
+            patch.object(
+                phase.executor, "check_available", return_value=(True, "v1.0")
+            ) as check,
+        ):
+            first = phase._check_agent_cli()
+            second = phase._check_agent_cli()
+
+        assert first == second
+        assert check.call_count == 1
+
+    def test_failed_probe_is_not_cached(self, phase: PreflightPhase):
+        """Test a failing CLI probe is re-run."""
+        with (
+            patch("selfassembler.phases.shutil.which", return_value=sys.executable),
+            patch.object(
+                phase.executor, "check_available", return_value=(False, "not found")
+            ) as check,
+        ):
+            phase._check_agent_cli()
+            phase._check_agent_cli()
+
+        assert check.call_count == 2
+
+    def test_malformed_cache_entry_is_ignored(self, phase: PreflightPhase, state_dir: Path):
+        """Test a cache entry of the wrong shape re-runs the probe."""
+        from selfassembler.phases import _probe_cache_key
+
+        cli = phase.executor.CLI_COMMAND
+        cache_file = state_dir / "selfassembler" / f"preflight-{cli}.json"
+        cache_file.parent.mkdir(parents=True)
+        with (
+            patch("selfassembler.phases.shutil.which", return_value=sys.executable),
+            patch.object(
+                phase.executor, "check_available", return_value=(True, "v1.0")
+            ) as check,
+        ):
+            cache_file.write_text(
+                json.dumps({"key": _probe_cache_key(cli), "checked_at": "soon", "result": "yes"})
+            )
+            result = phase._check_agent_cli()
+
+        assert result["passed"] is True
+        assert check.call_count == 1
+
+    def test_gh_setup_git_skipped_when_configured(self, phase: PreflightPhase):
+        """Test gh setup-git only runs when git lacks the gh credential helper."""
+        ok = MagicMock(returncode=0, stdout="")
+        with (
+            patch("selfassembler.phases.shutil.which", return_value=None),
+            patch("selfassembler.phases.subprocess.run", return_value=ok) as run,
+            patch(
+                "selfassembler.phases._gh_credential_helper_configured", return_value=True
+            ),
+        ):
+            result = phase._check_gh_cli()
+
+        assert result["passed"] is True
+        run.assert_called_once()
+        assert run.call_args[0][0] == ["gh", "auth", "status"]
+
+    def test_gh_auth_is_never_cached(self, phase: PreflightPhase):
+        """Test gh auth status is re-checked on every preflight."""
+        ok = MagicMock(returncode=0, stdout="")
+        with (
+            patch("selfassembler.phases.shutil.which", return_value=sys.executable),
+            patch("selfassembler.phases.subprocess.run", return_value=ok) as run,
+            patch(
+                "selfassembler.phases._gh_credential_helper_configured", return_value=True
+            ),
+        ):
+            phase._check_gh_cli()
+            phase._check_gh_cli()
+
+        assert run.call_count == 2
+
+    def test_run_reports_checks_in_order(self, phase: PreflightPhase):
+        """Test concurrent checks are reported in a stable order."""
+        names = ["agent_cli", "gh_cli", "git_identity", "git_clean", "git_updated"]
+        checks = {
+            f"_check_{name}": lambda *_, name=name: {"name": name, "passed": True}
+            for name in names
+        }
+        with patch.multiple(phase, **checks), patch("selfassembler.phases.GitManager"):
+            result = phase.run()
+
+        assert result.success is True
+        assert [c["name"] for c in result.artifacts["checks"]] == names
+
+    def test_gh_probe_finishes_before_git_checks(self, phase: PreflightPhase):
+        """Test the fetch only runs once gh has set up git credentials."""
+        order: list[str] = []
+
+        def gh_probe() -> dict:
+            time.sleep(0.05)
+            order.append("gh_cli")
+            return {"name": "gh_cli", "passed": True}
+
+        def git_checks() -> list[dict]:
+            order.append("git")
+            return []
+
+        with patch.multiple(
+            phase,
+            _check_agent_cli=lambda: {"name": "agent_cli", "passed": True},
+            _check_gh_cli=gh_probe,
+            _run_git_checks=git_checks,
+        ):
+            phase.run()
+
+        assert order == ["gh_cli", "git"]
+
 
 class TestResearchPhase:
     """Tests for ResearchPhase."""
@@ -178,6 +308,27 @@ class TestPlanReviewPhase:
         assert "Write" in PlanReviewPhase.allowed_tools
         assert "Read" in PlanReviewPhase.allowed_tools
 
+    def test_skips_without_plan_in_debate_mode(self, tmp_path: Path):
+        """Test a missing plan skips the phase before any debate starts."""
+        config = WorkflowConfig()
+        config.debate.enabled = True
+        context = WorkflowContext(
+            task_description="Test",
+            task_name="test",
+            repo_path=tmp_path,
+            plans_dir=tmp_path / "plans",
+        )
+        phase = PlanReviewPhase(
+            context, MockClaudeExecutor(), config, secondary_executor=MockCodexExecutor()
+        )
+
+        with patch.object(phase, "_run_with_debate") as run_with_debate:
+            result = phase.run()
+
+        assert result.success
+        assert result.artifacts == {"skipped": "No plan file found"}
+        run_with_debate.assert_not_called()
+
 
 class TestCodeReviewPhase:
     """Tests for CodeReviewPhase."""
@@ -188,6 +339,89 @@ class TestCodeReviewPhase:
         assert CodeReviewPhase.claude_mode == "plan"
 
 
+class TestPRCreationPhase:
+    """Tests for PRCreationPhase."""
+
+    def test_extract_pr_url(self):
+        """Test the PR URL and number are found in agent output."""
+        from selfassembler.phases import PRCreationPhase
+
+        phase = PRCreationPhase(
+            WorkflowContext(
+                task_description="Test",
+                task_name="test",
+                repo_path=Path("/test/repo"),
+                plans_dir=Path("/test/repo/plans"),
+            ),
+            MockClaudeExecutor(),
+            WorkflowConfig(),
+        )
+        output = "Created PR:\nhttps://github.com/owner/repo/pull/42\nDone."
+
+        assert phase._extract_pr_url(output) == ("https://github.com/owner/repo/pull/42", 42)
+        assert phase._extract_pr_url("gh: authentication required") is None
+
+        # The most recent PR URL wins; other GitHub links are skipped
+        output = (
+            "Similar to https://github.com/owner/repo/pull/7\n"
+            "https://github.com/owner/repo/pull/43\n"
+            "See https://github.com/owner/repo/issues/5"
+        )
+        assert phase._extract_pr_url(output) == ("https://github.com/owner/repo/pull/43", 43)
+
+
+class TestPRSelfReviewPhase:
+    """Tests for PRSelfReviewPhase."""
+
+    SMALL_DIFF = "--- a/app.py\n+++ b/app.py\n" + "+print('hello')\n" * 5
+
+    def _run(self, diff: str | None, has_remote: bool = False) -> tuple:
+        from selfassembler.phases import PRSelfReviewPhase
+
+        context = WorkflowContext(
+            task_description="Test",
+            task_name="test",
+            repo_path=Path("/test/repo"),
+            plans_dir=Path("/test/repo/plans"),
+        )
+        context.pr_number = 42
+        executor = MockClaudeExecutor()
+        phase = PRSelfReviewPhase(context, executor, WorkflowConfig())
+        with patch("selfassembler.phases.GitManager") as git_cls:
+            git_cls.return_value.has_remote.return_value = has_remote
+            git_cls.return_value.get_diff.return_value = diff
+            result = phase.run()
+            self.diff_base = git_cls.return_value.get_diff.call_args.args[0]
+        assert result.success
+        return result, executor.call_history
+
+    def test_small_diff_is_inlined(self):
+        """Test a small PR diff is embedded instead of fetched with gh."""
+        _, calls = self._run(self.SMALL_DIFF)
+        assert "+print('hello')" in calls[0]["prompt"]
+        assert "gh pr diff" not in calls[0]["prompt"]
+
+    def test_large_or_missing_diff_is_fetched(self):
+        """Test the reviewer falls back to gh pr diff."""
+        for diff in (None, "+x\n" * 20000):
+            _, calls = self._run(diff)
+            assert "gh pr diff 42" in calls[0]["prompt"]
+
+    def test_trivial_diff_skips_review(self):
+        """Test PRs changing fewer than min_diff_lines lines are not reviewed."""
+        result, calls = self._run("--- a/app.py\n+++ b/app.py\n-x = 1\n+x = 2\n")
+        assert result.artifacts["skipped"] == "trivial_diff"
+        assert calls == []
+
+    def test_diff_against_remote_base(self):
+        """Test the diff uses origin/<base>, which the branch was rebased onto."""
+        self._run(self.SMALL_DIFF, has_remote=True)
+        assert self.diff_base == "origin/main"
+
+        self._run(self.SMALL_DIFF, has_remote=False)
+        assert self.diff_base == "main"
+
+
 class TestPhasePermissionModeHelper:
     """Tests for _get_permission_mode helper method."""
 
@@ -418,6 +652,91 @@ class TestLintCheckSoftFail:
         assert len(result.warnings) == 1
         assert "Lint/typecheck issues remain" in result.warnings[0]
 
+    def test_no_changes_skips_checks(
+        self, context: WorkflowContext, executor: MockClaudeExecutor
+    ):
+        """Test lint_check can be skipped when nothing changed against the base branch."""
+        from selfassembler.phases import LintCheckPhase
+
+        config = WorkflowConfig()
+        config.phases.lint_check.require_scan_on_empty = False
+        phase = LintCheckPhase(context, executor, config)
+
+        with patch("selfassembler.phases.get_command", return_value="ruff check ."), \
+             patch("selfassembler.phases.GitManager") as mock_git_manager, \
+             patch("selfassembler.phases.run_command") as mock_run:
+            mock_git_manager.return_value.get_changed_files.return_value = []
+            result = phase.run()
+
+        assert result.success is True
+        assert result.artifacts == {"skipped": "No changes vs base branch"}
+        mock_run.assert_not_called()
+
+    def test_fix_without_edits_stops_loop(
+        self, context: WorkflowContext, executor: MockClaudeExecutor
+    ):
+        """Test a fix that leaves the savepoint untouched ends the loop without a re-run."""
+        from selfassembler.errors import FailureCategory
+        from selfassembler.phases import LintCheckPhase
+
+        config = WorkflowConfig()
+        config.phases.lint_check.max_iterations = 3
+        phase = LintCheckPhase(context, executor, config)
+
+        def _mock_get_command(_workdir: Path, command_type: str, *_args: object) -> str | None:
+            return "ruff check ." if command_type == "lint" else None
+
+        with patch("selfassembler.phases.get_command", side_effect=_mock_get_command), \
+             patch("selfassembler.phases.GitManager") as mock_git_manager, \
+             patch.object(phase, "_fix_lint_issues", return_value="session-1"), \
+             patch(
+                 "selfassembler.phases.run_command",
+                 return_value=(False, "app.py:1: error: E999 boom", ""),
+             ) as mock_run:
+            mock_git_manager.return_value.get_changed_files.return_value = ["app.py"]
+            mock_git_manager.return_value.has_unstaged_changes.return_value = False
+            result = phase.run()
+
+        assert result.success is False
+        assert result.failure_category == FailureCategory.OSCILLATING
+        # One lint run and one savepoint, no re-run
+        assert [c.args[1] for c in mock_run.call_args_list] == ["ruff check .", "git add -A"]
+
+
+class TestParseErrorLocations:
+    """Tests for LintCheckPhase._parse_error_locations."""
+
+    def test_parses_common_formats(self):
+        """Test mypy, ruff and eslint locations are fingerprinted."""
+        from selfassembler.phases import LintCheckPhase
+
+        output = (
+            "app.py:42: error: Incompatible types [assignment]\n"
+            "lib/util.py:7:10: E501 Line too long\n"
+            "/src/index.js:3:5  error  Unexpected var\n"
+            "Found 3 errors in 3 files\n"
+        )
+
+        assert LintCheckPhase._parse_error_locations(output) == frozenset(
+            {"app.py:42", "lib/util.py:7:10", "/src/index.js:3:5"}
+        )
+
+    def test_no_locations(self):
+        """Test output without locations yields an empty set."""
+        from selfassembler.phases import LintCheckPhase
+
+        assert LintCheckPhase._parse_error_locations("All checks passed!\n") == frozenset()
+
+    def test_long_output_scans_leading_complete_lines(self):
+        """Test very long output is cut at a line boundary before parsing."""
+        from selfassembler.phases import _MAX_PARSE_CHARS, LintCheckPhase
+
+        line = "src/mod.py:1:1: E501 Line too long\n"
+        filler = "x" * (_MAX_PARSE_CHARS - len(line) - 10) + "\n"
+        output = line + filler + "src/late.py:12:5: E501 Line too long\n"
+
+        assert LintCheckPhase._parse_error_locations(output) == frozenset({"src/mod.py:1:1"})
+
 
 class TestTestExecutionBaselineDiff:
     """Tests for TestExecutionPhase baseline-diff behavior."""
@@ -649,6 +968,133 @@ class TestTestExecutionBaselineDiff:
         assert result.failure_category == FailureCategory.FATAL
         assert "could not restore stashed changes" in (result.error or "")
 
+    def test_baseline_reused_across_runs_for_same_head(
+        self,
+        context: WorkflowContext,
+        executor: MockClaudeExecutor,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test a clean worktree skips the stash and later runs reuse the stored baseline."""
+        from selfassembler.phases import TestExecutionPhase
+
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+        config = WorkflowConfig()
+        failing = {
+            "passed": 5, "failed": 1, "skipped": 0, "total": 6,
+            "failures": ["FAILED tests/test_a.py::test_x"],
+            "failure_ids": ["tests/test_a.py::test_x"],
+            "all_passed": False,
+        }
+
+        with patch("selfassembler.phases.get_command", return_value="pytest"), \
+             patch("selfassembler.phases.GitManager") as mock_git, \
+             patch("selfassembler.phases.run_command") as mock_run, \
+             patch("selfassembler.phases.parse_test_output", return_value=failing), \
+             patch("selfassembler.phases.load_known_failures", return_value=[]):
+            mock_git.return_value.get_head_sha.return_value = "abc123"
+            mock_git.return_value.is_clean.return_value = (True, "")
+            mock_run.return_value = (False, "FAILED tests/test_a.py::test_x", "")
+
+            first = TestExecutionPhase(context, executor, config).run()
+            # Baseline run + iteration 0; no stash push/pop on a clean worktree
+            assert mock_run.call_count == 2
+
+            mock_run.reset_mock()
+            fresh_context = WorkflowContext(
+                task_description="Test",
+                task_name="test",
+                repo_path=Path("/test/repo"),
+                plans_dir=Path("/test/repo/plans"),
+            )
+            second = TestExecutionPhase(fresh_context, executor, config).run()
+            # Only iteration 0; the baseline came from the state store
+            assert mock_run.call_count == 1
+
+        assert first.success is True
+        assert second.success is True
+        assert fresh_context.get_artifact("test_baseline_failures") == ["tests/test_a.py::test_x"]
+
+    @pytest.mark.parametrize(
+        "stored",
+        [
+            ["tests/test_a.py::test_x"],
+            "garbage",
+            {"failure_ids": ["tests/test_a.py::test_x"], "exit_ok": False},
+            {"failure_ids": ["tests/test_a.py::test_x"], "exit_ok": False, "captured_at": 0},
+        ],
+        ids=["list", "string", "no-timestamp", "expired"],
+    )
+    def test_unusable_stored_baseline_is_recaptured(
+        self,
+        context: WorkflowContext,
+        executor: MockClaudeExecutor,
+        tmp_path: Path,
+        stored: object,
+    ):
+        """Test malformed or expired stored baselines trigger a fresh capture."""
+        from selfassembler.phases import TestExecutionPhase
+
+        phase = TestExecutionPhase(context, executor, WorkflowConfig())
+
+        with patch("selfassembler.phases.GitManager") as mock_git, \
+             patch("selfassembler.phases.StateStore") as mock_store, \
+             patch("selfassembler.phases.run_command") as mock_run, \
+             patch("selfassembler.phases.parse_test_output", return_value={"failure_ids": []}):
+            mock_git.return_value.get_head_sha.return_value = "abc123"
+            mock_git.return_value.is_clean.return_value = (True, "")
+            mock_store.return_value.load.return_value = stored
+            mock_run.return_value = (True, "", "")
+
+            baseline, warning = phase._capture_baseline(tmp_path, "pytest")
+
+        assert baseline == []
+        assert warning is None
+        mock_run.assert_called_once_with(tmp_path, "pytest", timeout=300)
+
+    def test_recurring_errors_detected_as_oscillation(
+        self, context: WorkflowContext, executor: MockClaudeExecutor
+    ):
+        """Test the same error fingerprints twice stops the fix loop."""
+        from selfassembler.errors import FailureCategory
+        from selfassembler.phases import TestExecutionPhase
+
+        config = WorkflowConfig()
+        config.phases.test_execution.baseline_enabled = False
+        phase = TestExecutionPhase(context, executor, config)
+
+        failing = (False, "tests/test_a.py:12: AssertionError", "")
+        with patch("selfassembler.phases.get_command", return_value="pytest"), \
+             patch("selfassembler.phases.run_command", return_value=failing), \
+             patch.object(phase, "_fix_failures", return_value="session-1") as mock_fix:
+
+            result = phase.run()
+
+        assert result.success is False
+        assert result.failure_category == FailureCategory.OSCILLATING
+        assert mock_fix.call_count == 1
+
+    def test_failure_output_artifact_keeps_tail(
+        self, context: WorkflowContext, executor: MockClaudeExecutor
+    ):
+        """Test verbose test output is capped to its summary tail in the result."""
+        from selfassembler.phases import TestExecutionPhase
+
+        config = WorkflowConfig()
+        config.phases.test_execution.baseline_enabled = False
+        phase = TestExecutionPhase(context, executor, config)
+
+        failing = (False, "collected\n" * 10000, "tests/test_a.py:12: AssertionError")
+        with patch("selfassembler.phases.get_command", return_value="pytest"), \
+             patch("selfassembler.phases.run_command", return_value=failing), \
+             patch.object(phase, "_fix_failures", return_value="session-1"):
+
+            result = phase.run()
+
+        assert result.success is False
+        assert len(result.artifacts["output"]) == 8 * 1024
+        assert result.artifacts["output"].endswith("tests/test_a.py:12: AssertionError")
+
 
 class TestFinalVerificationBaselineDiff:
     """Tests for FinalVerificationPhase baseline-diff behavior."""